@@ -8,19 +8,21 @@ completely API-agnostic way through the ResponseUnwrapper protocol.
 
 import asyncio
 import hashlib
+import importlib.util
 import json
 import ssl
 import time
+import weakref
 from collections.abc import Mapping
 from datetime import UTC, datetime as dt
 from email.utils import parsedate_to_datetime
 from http import HTTPStatus
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 import certifi
 import httpx
 import tenacity
-from cachetools import TTLCache  # type: ignore[import-untyped]
+from cachetools import LRUCache, TTLCache  # type: ignore[import-untyped]
 from tenacity import (
     AsyncRetrying,
     stop_after_attempt,
@@ -69,6 +71,8 @@ class BaseApiClient:
         _base_url: The base URL for API requests.
         _retryable_status_codes: HTTP status codes that trigger a retry.
         _cache: Optional TTL cache for GET requests.
+        _validator_cache: Optional LRU cache of ETag/Last-Modified validators and
+            the cached item they belong to, used to revalidate expired entries.
         _auth_strategy: Authentication strategy instance.
         _http_client: The underlying httpx.AsyncClient for making requests.
         _should_close_client: Flag indicating if this instance owns the _http_client.
@@ -76,6 +80,8 @@ class BaseApiClient:
         _rate_limit_remaining: Last observed remaining requests in the current window.
         _rate_limit_reset_timestamp: Timestamp for when the rate limit window resets.
         _rate_limit_lock: Lock for synchronizing access to rate limit state.
+        _inflight_requests: In-flight GET requests, keyed for coalescing.
+        _inflight_waiters: Number of callers awaiting each in-flight request.
     """
 
     DEFAULT_RETRYABLE_STATUS_CODES: frozenset[int] = frozenset(
@@ -83,6 +89,14 @@ class BaseApiClient:
     )
     """Default set of HTTP status codes considered retryable."""
 
+    _shared_http_clients: ClassVar[
+        weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[Any, ...], httpx.AsyncClient]
+        ]
+    ]
+    """HTTP clients shared by instances of this class created with ``share_http_client=True``,
+    per event loop and keyed by the settings each client was built from."""
+
     def __init__(
         self,
         settings: BaseApiSettings,
@@ -92,6 +106,7 @@ class BaseApiClient:
         base_url: str,
         http_client: httpx.AsyncClient | None = None,
         retryable_status_codes: frozenset[int] = DEFAULT_RETRYABLE_STATUS_CODES,
+        share_http_client: bool = False,
     ):
         """Initialize the BaseApiClient.
 
@@ -103,6 +118,17 @@ class BaseApiClient:
             base_url: The base URL for API requests.
             http_client: Optional pre-configured httpx.AsyncClient instance.
             retryable_status_codes: Set of HTTP status codes to retry on.
+            share_http_client: If True and no http_client is given, reuse a
+                single httpx.AsyncClient (and its connection pool) across
+                instances of this client class instead of creating one per
+                instance. Only instances created on the same running event
+                loop with the same base URL, request timeout, User-Agent and
+                HTTP/2 setting share a client; otherwise an instance gets its
+                own shared client, since pooled connections cannot be reused
+                across event loops. Instances created outside a running event
+                loop get a dedicated client instead. Shared clients are not
+                closed by aclose(); use aclose_shared_http_client() when
+                shutting down.
 
         Note:
             The base_url should be provided by the specific API client implementation
@@ -127,6 +153,13 @@ class BaseApiClient:
         else:
             logger.debug("Client-side caching is disabled.")
 
+        # Validators outlive the TTL so expired entries can be revalidated
+        self._validator_cache: LRUCache[str, tuple[dict[str, str], Any]] | None = None
+        if self._cache is not None and self._settings.enable_conditional_requests:
+            self._validator_cache = LRUCache(  # type: ignore[type-arg]
+                maxsize=self._settings.cache_max_size
+            )
+
         # Set up authentication strategy
         self._auth_strategy: AuthStrategy = auth_strategy or NoAuth()
         logger.debug(
@@ -134,6 +167,8 @@ class BaseApiClient:
         )
 
         # HTTP client setup
+        if http_client is None and share_http_client:
+            http_client = self._get_shared_http_client()
         self._should_close_client = http_client is None  # Close only if we created it
         self._http_client = http_client or self._create_default_http_client()
 
@@ -143,6 +178,12 @@ class BaseApiClient:
         self._rate_limit_reset_timestamp: float | None = None  # Unix timestamp
         self._rate_limit_lock = asyncio.Lock()
 
+        # In-flight GET requests shared by identical concurrent callers
+        self._inflight_requests: dict[
+            tuple[Any, ...], asyncio.Task[tuple[httpx.Response, Any | None, int]]
+        ] = {}
+        self._inflight_waiters: dict[asyncio.Task[Any], int] = {}
+
         logger.debug("BaseApiClient initialized.")
 
     def _create_default_http_client(self) -> httpx.AsyncClient:
@@ -150,7 +191,7 @@ class BaseApiClient:
 
         Returns:
             httpx.AsyncClient: Configured HTTP client with SSL verification,
-                timeout settings, and user agent header.
+                timeout settings, user agent header, and HTTP/2 if enabled.
         """
         try:
             ssl_context = ssl.create_default_context(cafile=certifi.where())
@@ -162,12 +203,79 @@ class BaseApiClient:
                 "certifi not found or failed to load. Using default SSL verification."
             )
 
+        http2 = self._settings.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            http2 = False
+            logger.warning(
+                "HTTP/2 requested but the 'h2' package is not installed "
+                "(install 'bibliofabric[http2]'). Falling back to HTTP/1.1."
+            )
+
         return httpx.AsyncClient(
             base_url=self._base_url,
             timeout=self._settings.request_timeout,
             verify=verify_ssl,
             headers={"User-Agent": self._settings.user_agent},
+            http2=http2,
+        )
+
+    def _get_shared_http_client(self) -> httpx.AsyncClient | None:
+        """Return the class-level shared HTTP client, creating it if needed.
+
+        Shared clients are stored per concrete class, so different API
+        clients built on bibliofabric do not share connection pools. Within a
+        class they are stored per running event loop, because pooled
+        connections are bound to the loop that opened them, and keyed by the
+        settings the client is built from, so an instance never reuses a
+        client configured for different settings. Clients of an event loop
+        are dropped once that loop is garbage collected.
+
+        Returns:
+            httpx.AsyncClient | None: The shared HTTP client for this client
+                class, event loop and settings, or None if there is no running
+                event loop to share it on.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug(
+                "share_http_client requested outside a running event loop; "
+                "using a dedicated HTTP client."
+            )
+            return None
+
+        cls = type(self)
+        per_loop = cls.__dict__.get("_shared_http_clients")
+        if per_loop is None:
+            per_loop = weakref.WeakKeyDictionary()
+            cls._shared_http_clients = per_loop
+        shared_clients = per_loop.setdefault(loop, {})
+
+        key = (
+            self._base_url,
+            self._settings.request_timeout,
+            self._settings.user_agent,
+            self._settings.http2,
         )
+        shared = shared_clients.get(key)
+        if shared is None or shared.is_closed:
+            shared = self._create_default_http_client()
+            shared_clients[key] = shared
+            logger.debug(f"Created shared HTTP client for {cls.__name__}.")
+        return shared
+
+    @classmethod
+    async def aclose_shared_http_client(cls) -> None:
+        """Close the shared HTTP clients of this client class on the running event loop."""
+        per_loop = cls.__dict__.get("_shared_http_clients")
+        if per_loop is None:
+            return
+        shared_clients = per_loop.pop(asyncio.get_running_loop(), {})
+        for shared in shared_clients.values():
+            if not shared.is_closed:
+                await shared.aclose()
+        if shared_clients:
+            logger.debug(f"Shared HTTP clients for {cls.__name__} closed.")
 
     async def _parse_rate_limit_headers(self, response: httpx.Response) -> float | None:
         """Parse rate limit headers from the response and update client state.
@@ -340,10 +448,12 @@ class BaseApiClient:
                     response=response,
                 )
 
-            # Successful response, try parsing if expected_model is provided
-            if expected_model:
+            # Successful response, try parsing if expected_model is provided.
+            # Validating the raw bytes lets pydantic-core parse the JSON directly,
+            # skipping the intermediate Python dict built by response.json().
+            if expected_model and response.status_code != HTTPStatus.NOT_MODIFIED:
                 try:
-                    parsed_model = expected_model.model_validate(response.json())
+                    parsed_model = expected_model.model_validate_json(response.content)
                 except Exception as e:
                     logger.warning(
                         f"Response model validation failed for {request.url}: {e}. "
@@ -478,6 +588,7 @@ class BaseApiClient:
         data: Mapping[str, Any] | None = None,
         base_url_override: str | None = None,
         expected_model: type[Any] | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> tuple[httpx.Response, Any | None, int]:
         """Make an HTTP request with configured retries for transient errors.
 
@@ -489,6 +600,7 @@ class BaseApiClient:
             data: Form data for request body.
             base_url_override: Optional override for the base URL.
             expected_model: Optional Pydantic model for response parsing.
+            headers: Optional extra request headers.
 
         Returns:
             tuple[httpx.Response, Any | None, int]: The HTTP response, optionally
@@ -507,7 +619,8 @@ class BaseApiClient:
             params=params,
             json_data=json_data,
             data=data,
-            # Headers will be populated by auth strategy and pre-request hooks
+            headers=dict(headers or {}),
+            # Further headers are populated by auth strategy and pre-request hooks
         )
 
         # Pre-request rate limit check
@@ -620,6 +733,53 @@ class BaseApiClient:
             f"after {retry_state.attempt_number} attempt(s) due to: {type(exc).__name__} - {exc}"
         )
 
+    async def _coalesced_request_with_retry(
+        self, coalesce_key: tuple[Any, ...], **kwargs: Any
+    ) -> tuple[httpx.Response, Any | None, int]:
+        """Run _request_with_retry, sharing one in-flight call per key.
+
+        Concurrent callers with the same key await the same underlying request
+        instead of each sending their own. The request is shielded, so a
+        cancelled caller does not cancel it for the others; once the last
+        waiting caller is cancelled, the request (and any pending retries) is
+        cancelled as well.
+
+        Args:
+            coalesce_key: Key identifying identical requests.
+            **kwargs: Arguments forwarded to _request_with_retry.
+
+        Returns:
+            tuple[httpx.Response, Any | None, int]: The result of the shared request.
+        """
+        inflight = self._inflight_requests
+
+        def forget(done: asyncio.Task[Any]) -> None:
+            # A newer request may already be registered under the same key
+            if inflight.get(coalesce_key) is done:
+                del inflight[coalesce_key]
+
+        task = inflight.get(coalesce_key)
+        if task is None or task.done() or task.cancelling():
+            task = asyncio.create_task(self._request_with_retry(**kwargs))
+            inflight[coalesce_key] = task
+            task.add_done_callback(forget)
+        else:
+            logger.debug(f"Joining in-flight request for {kwargs.get('path')}")
+
+        waiters = self._inflight_waiters
+        waiters[task] = waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            waiters[task] -= 1
+            if not waiters[task]:
+                del waiters[task]
+                if not task.done():
+                    # Nobody is waiting any more, so stop the request and its
+                    # retries, and keep later callers from joining it
+                    forget(task)
+                    task.cancel()
+
     def _generate_cache_key(
         self, method: str, url: str, params: Mapping[str, Any] | None = None
     ) -> str:
@@ -680,9 +840,19 @@ class BaseApiClient:
                 raw response if parsing fails.
 
         Note:
-            GET requests are automatically cached when caching is enabled and
-            an expected_model is provided. Cache hits return the parsed model
-            directly without making an HTTP request.
+            Successful GET requests are automatically cached when caching is
+            enabled. With an expected_model the parsed model is cached; without
+            one the raw httpx.Response is cached only if ``cache_raw_responses``
+            is set, and otherwise the cache is not consulted at all. Cache hits
+            of the expected type are returned directly without making an HTTP
+            request; an entry of another type counts as a miss and is left in
+            place. With
+            ``enable_conditional_requests``, expired entries whose response
+            carried an ETag or Last-Modified header are revalidated with
+            If-None-Match / If-Modified-Since; on 304 Not Modified the
+            previously cached item is returned without re-parsing a body.
+            With ``coalesce_requests``, concurrent identical GET requests share
+            a single HTTP call and receive the same result.
         """
         actual_json_data = json_data if json_data is not None else json
         if json is not None and json_data is not None:
@@ -691,43 +861,84 @@ class BaseApiClient:
             )
 
         cache_key: str | None = None
+        stale_item: Any | None = None
+        request_headers: dict[str, str] = {}
 
         # --- Cache Check (for GET requests) ---
-        if self._cache is not None and method.upper() == "GET":
+        # Raw requests only use the cache when raw-response caching is enabled
+        if (
+            self._cache is not None
+            and method.upper() == "GET"
+            and (expected_model or self._settings.cache_raw_responses)
+        ):
             _target_base_url = (base_url_override or self._base_url).rstrip("/")
             full_url = f"{_target_base_url}/{path.lstrip('/')}"
             cache_key = self._generate_cache_key(method, full_url, params)
 
             cached_item = self._cache.get(cache_key)
             if cached_item is not None:
-                # Assuming the cached item is the already parsed Pydantic model
+                # Cached item is either the parsed model or the raw response
                 logger.debug(f"Cache hit for key: {cache_key}")
-                if expected_model and not isinstance(cached_item, expected_model):
-                    logger.warning(
+                expected_type = expected_model or httpx.Response
+                if not isinstance(cached_item, expected_type):
+                    # Leave the entry in place; it may still serve other callers
+                    logger.debug(
                         f"Cache hit for {cache_key}, but type mismatch. "
-                        f"Expected {expected_model}, got {type(cached_item)}. Discarding cache."
+                        f"Expected {expected_type}, got {type(cached_item)}. Treating as a miss."
                     )
-                    self._cache.pop(cache_key, None)  # Treat as cache miss
                 else:
-                    logger.debug(f"Returning cached parsed model for key: {cache_key}")
-                    return cached_item  # cached_item is the parsed_model
+                    logger.debug(f"Returning cached item for key: {cache_key}")
+                    return cached_item
+
+            # --- Conditional Revalidation (expired entries with validators) ---
+            if self._validator_cache is not None:
+                validated = self._validator_cache.get(cache_key)
+                if validated is not None and isinstance(
+                    validated[1], expected_model or httpx.Response
+                ):
+                    request_headers, stale_item = validated
+                    logger.debug(f"Revalidating cached item for key: {cache_key}")
 
         # --- Execute Request (if not a cache hit or not cacheable) ---
-        response, parsed_model, attempts = await self._request_with_retry(
-            method=method,
-            path=path,
-            params=params,
-            json_data=actual_json_data,
-            data=data,
-            base_url_override=base_url_override,
-            expected_model=expected_model,
-        )
+        request_kwargs: dict[str, Any] = {
+            "method": method,
+            "path": path,
+            "params": params,
+            "json_data": actual_json_data,
+            "data": data,
+            "base_url_override": base_url_override,
+            "expected_model": expected_model,
+        }
+        if request_headers:
+            request_kwargs["headers"] = request_headers
+        if self._settings.coalesce_requests and method.upper() == "GET":
+            _target_base_url = (base_url_override or self._base_url).rstrip("/")
+            coalesce_key = (
+                self._generate_cache_key(
+                    method, f"{_target_base_url}/{path.lstrip('/')}", params
+                ),
+                expected_model,
+                tuple(sorted(request_headers.items())),
+            )
+            response, parsed_model, attempts = await self._coalesced_request_with_retry(
+                coalesce_key, **request_kwargs
+            )
+        else:
+            response, parsed_model, attempts = await self._request_with_retry(
+                **request_kwargs
+            )
+
+        # --- Not Modified: the stale cached item is still current ---
+        if response.status_code == HTTPStatus.NOT_MODIFIED and stale_item is not None:
+            logger.debug(f"Not modified, reusing cached item for key: {cache_key}")
+            if self._cache is not None and cache_key is not None:
+                self._cache[cache_key] = stale_item
+            return stale_item
 
-        # --- Cache Store (for successful GET requests with a successfully parsed model) ---
+        # --- Cache Store (for successful GET requests) ---
         if (
             self._cache is not None
             and cache_key is not None  # Implies GET and cache enabled
-            and method.upper() == "GET"
             and HTTPStatus.OK
             <= response.status_code
             < HTTPStatus.MULTIPLE_CHOICES  # 2xx
@@ -748,6 +959,25 @@ class BaseApiClient:
                 logger.debug(
                     f"GET request for {cache_key} successful, but model parsing failed or no model to parse. Not caching."
                 )
+            elif self._settings.cache_raw_responses:
+                # The body has already been read, so the response can be reused
+                self._cache[cache_key] = response
+                logger.debug(f"Cached raw response for key: {cache_key}")
+
+            if self._validator_cache is not None and cache_key in self._cache:
+                validators = {
+                    request_header: response.headers[response_header]
+                    for response_header, request_header in (
+                        ("ETag", "If-None-Match"),
+                        ("Last-Modified", "If-Modified-Since"),
+                    )
+                    if response_header in response.headers
+                }
+                if validators:
+                    self._validator_cache[cache_key] = (
+                        validators,
+                        self._cache[cache_key],
+                    )
 
         # --- Standard Response Handling ---
         if expected_model:
@@ -42,6 +42,10 @@ class BaseApiSettings(BaseSettings):
         default=f"bibliofabric/{_VERSION}",
         description="User-Agent header for requests",
     )
+    http2: bool = Field(
+        default=False,
+        description="Enable HTTP/2 on the default HTTP client (requires 'bibliofabric[http2]')",
+    )
 
     # --- Rate Limiting Settings ---
     enable_rate_limiting: bool = Field(
@@ -67,6 +71,18 @@ class BaseApiSettings(BaseSettings):
     cache_max_size: int = Field(
         default=128, description="Maximum number of items in the LRU cache"
     )
+    cache_raw_responses: bool = Field(
+        default=False,
+        description="Also cache raw responses of GET requests made without an expected model",
+    )
+    enable_conditional_requests: bool = Field(
+        default=False,
+        description="Revalidate expired cache entries with ETag/Last-Modified conditional requests",
+    )
+    coalesce_requests: bool = Field(
+        default=False,
+        description="Share one HTTP call between concurrent identical GET requests",
+    )
 
     # --- Hook Settings ---
     pre_request_hooks: list[PreRequestHook] = Field(
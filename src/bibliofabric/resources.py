@@ -11,12 +11,14 @@ from multiple mixins as needed to provide the appropriate functionality for that
 specific resource type.
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterable
 from typing import TYPE_CHECKING, Any, Protocol
 
 from pydantic import BaseModel
 
-from .exceptions import BibliofabricError
+from .exceptions import BibliofabricError, ValidationError
 from .log_config import logger
 
 if TYPE_CHECKING:
@@ -39,6 +41,7 @@ class ResourceClientProtocol(Protocol):
     )  # Pydantic model for the search/list response envelope
     _base_url_override: str | None
     _supports_direct_get: bool
+    _stop_on_short_page: bool
     _param_page: str
     _param_page_size: str
     _param_sort: str
@@ -74,10 +77,15 @@ class BaseResourceClient:
             that represents the structure of a search or list response envelope for
             this resource. If provided, `search()` will attempt to parse the entire
             response into this model.
+        _stop_on_short_page: If True, page-based iteration stops as soon as a
+            page returns fewer results than the requested page size, saving the
+            trailing request for an empty page. Leave disabled for APIs that
+            may silently cap the page size below the requested value.
     """
 
     _base_url_override: str | None = None
     _supports_direct_get: bool = False
+    _stop_on_short_page: bool = False
     _param_page: str = "page"
     _param_page_size: str = "pageSize"
     _param_sort: str = "sortBy"
@@ -270,6 +278,84 @@ class BaseResourceClient:
         )
         return results[0] if results else None
 
+    async def collect_many(
+        self,
+        filters_list: Iterable[BaseModel | dict[str, Any]],
+        *,
+        limit: int | None = None,
+        sort_by: str | None = None,
+        page_size: int = 100,
+        search: str | None = None,
+        concurrency: int = 5,
+    ) -> list[list[Any]]:
+        """Collect results for several filter sets concurrently.
+
+        Useful when the same query has to be run for many values that the API
+        cannot combine into a single request (e.g., one query per identifier).
+        Each distinct filter set is collected once with ``collect()``, with at
+        most ``concurrency`` collections in flight at once. Filter sets that
+        serialize to the same query parameters share a single query. If one
+        query fails, the queries still running or waiting are cancelled and
+        the first error is raised.
+
+        Args:
+            filters_list: Filter criteria, one entry per query.
+            limit: Maximum number of results to collect per query.
+            sort_by: Field to sort by.
+            page_size: Number of results per page during iteration.
+            search: Free-text search query applied to every query.
+            concurrency: Maximum number of queries running at once.
+
+        Returns:
+            One list of entities per filter set, in the order of ``filters_list``.
+            Duplicate filter sets are fetched once and get their own list, but the
+            entity objects in those lists are shared.
+
+        Raises:
+            ValidationError: If ``concurrency`` is less than 1.
+            BibliofabricError: The first error raised by any of the queries.
+        """
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+
+        # Deduplicate on the serialized query so repeated values cost one query
+        unique: dict[str, BaseModel | dict[str, Any]] = {}
+        keys: list[str] = []
+        for filters in filters_list:
+            key = json.dumps(
+                self._serialize_filters(filters), sort_keys=True, default=str
+            )
+            unique.setdefault(key, filters)
+            keys.append(key)
+        if len(unique) < len(keys):
+            logger.debug(
+                f"collect_many: {len(keys)} filter sets, {len(unique)} unique queries"
+            )
+
+        # A fixed pool of workers takes queries from a shared queue, so a
+        # failed worker never picks up another query
+        queue = iter(unique.items())
+        by_key: dict[str, list[Any]] = {}
+
+        async def worker() -> None:
+            for key, filters in queue:
+                by_key[key] = await self.collect(
+                    filters=filters,
+                    limit=limit,
+                    sort_by=sort_by,
+                    page_size=page_size,
+                    search=search,
+                )
+
+        # The TaskGroup cancels the other workers as soon as one fails
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(concurrency, len(unique))):
+                    group.create_task(worker())
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return [list(by_key[key]) for key in keys]
+
 
 class GettableMixin:
     """Mixin that provides generic get() functionality for retrieving single entities.
@@ -319,7 +405,6 @@ class GettableMixin:
                 response = await self._api_client.request(
                     "GET",
                     direct_path,
-                    params=None,
                     base_url_override=self._base_url_override,
                 )
                 response_data = response.json()
@@ -488,6 +573,8 @@ class CursorIterableMixin:
         sort_by: str | None = None,
         filters: BaseModel | dict[str, Any] | None = None,
         search: str | None = None,
+        *,
+        prefetch: bool = False,
     ) -> AsyncIterator[Any]:
         """Iterate through all entities matching the criteria using cursor pagination.
 
@@ -495,10 +582,15 @@ class CursorIterableMixin:
         successive pages of results. It yields individual entities as they are
         retrieved from each page.
 
+        With ``prefetch`` enabled, the request for the next page is started as
+        soon as its cursor is known, so it runs while the caller consumes the
+        current page. At most one page is fetched ahead.
+
         Args:
             page_size: Number of results to fetch per API call during iteration.
             sort_by: Field to sort by.
             filters: Filter criteria as a Pydantic model or dictionary.
+            prefetch: Fetch the next page while the current one is consumed.
 
         Yields:
             Any: Individual entities, either as parsed Pydantic models (if
@@ -518,84 +610,116 @@ class CursorIterableMixin:
             f"Iterating {self._entity_path}: pageSize={page_size}, "
             f"sort='{sort_by}', filters={filter_dict}"
         )
-        # Build initial parameters with cursor pagination
-        current_params: dict[
-            str, Any
-        ] = {  # Renamed to current_params for clarity in loop
+        # Build the parameters shared by every page once, outside the loop
+        base_params: dict[str, Any] = {
             self._param_cursor: "*",  # Start cursor for iteration
             self._param_page_size: page_size,
         }
 
         if sort_by:
-            current_params[self._param_sort] = self._normalize_sort(sort_by)
+            base_params[self._param_sort] = self._normalize_sort(sort_by)
 
         if filter_dict:
-            current_params.update(filter_dict)
+            base_params.update(filter_dict)
         if search is not None and self._param_search:
-            current_params[self._param_search] = search
+            base_params[self._param_search] = search
+        # Remove page if it accidentally got in, cursor handles pagination
+        base_params.pop(self._param_page, None)
 
-        while True:
-            try:
-                logger.debug(
-                    f"Iterating {self._entity_path} with params: {current_params}"
-                )
+        # Resolve per-page lookups once rather than on every page and entity
+        unwrapper = self.response_unwrapper
+        entity_model = self._entity_model
 
-                # Pass a copy of params to avoid issues with mock call_args_list
-                response = await self._api_client.request(
-                    "GET",
-                    self._entity_path,
-                    params=current_params.copy(),
-                    base_url_override=self._base_url_override,
-                )
+        async def fetch_page(page_params: dict[str, Any]) -> Any:
+            logger.debug(f"Iterating {self._entity_path} with params: {page_params}")
+            response = await self._api_client.request(
+                "GET",
+                self._entity_path,
+                params=page_params,
+                base_url_override=self._base_url_override,
+            )
+            return response.json()
 
-                response_data = response.json()
+        current_params = base_params
+        pending: asyncio.Task[Any] | None = None
+        try:
+            while True:
+                try:
+                    if pending is not None:
+                        response_data = await pending
+                        pending = None
+                    else:
+                        response_data = await fetch_page(current_params)
 
-                # Use the response unwrapper to get results and next cursor
-                results = self.response_unwrapper.unwrap_results(response_data)
-                next_cursor = self.response_unwrapper.get_next_page_token(response_data)
+                    # Use the response unwrapper to get results
+                    results = unwrapper.unwrap_results(response_data)
 
-                if not results:
-                    logger.debug(
-                        f"No more results for {self._entity_path}, stopping iteration."
-                    )
-                    break
+                    if not results:
+                        logger.debug(
+                            f"No more results for {self._entity_path}, stopping iteration."
+                        )
+                        break
+
+                    # An empty page never needs the cursor
+                    next_cursor = unwrapper.get_next_page_token(response_data)
+                    if next_cursor and prefetch:
+                        # Request the next page while this one is being consumed
+                        pending = asyncio.ensure_future(
+                            fetch_page({**base_params, self._param_cursor: next_cursor})
+                        )
 
-                # Yield each result
-                for result_data in results:
-                    # Parse with entity model if available
-                    if self._entity_model:
-                        try:
-                            yield self._entity_model.model_validate(result_data)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to parse entity data with {self._entity_model.__name__}: {e}. "
-                                "Yielding raw data."
-                            )
+                    # Yield each result
+                    for result_data in results:
+                        # Parse with entity model if available
+                        if entity_model:
+                            try:
+                                yield entity_model.model_validate(result_data)
+                            except Exception as e:
+                                logger.warning(
+                                    f"Failed to parse entity data with {entity_model.__name__}: {e}. "
+                                    "Yielding raw data."
+                                )
+                                yield result_data
+                        else:
                             yield result_data
-                    else:
-                        yield result_data
 
-                # Check if there are more pages
-                if not next_cursor:
-                    logger.debug(
-                        f"No nextCursor for {self._entity_path}, stopping iteration."
-                    )
-                    break
+                    # Check if there are more pages
+                    if not next_cursor:
+                        logger.debug(
+                            f"No nextCursor for {self._entity_path}, stopping iteration."
+                        )
+                        break
 
-                # Update cursor for next iteration
-                current_params[self._param_cursor] = next_cursor
-                # Remove page if it accidentally got in, cursor handles pagination
-                current_params.pop(self._param_page, None)
+                    # Each page gets a fresh dict; only the cursor changes
+                    current_params = {**base_params, self._param_cursor: next_cursor}
 
-            except Exception as e:
-                if isinstance(e, BibliofabricError):
-                    raise
-                logger.exception(
-                    f"Failed during iteration of {self._entity_path} with params {current_params}"
-                )
-                raise BibliofabricError(
-                    f"Unexpected error during iteration of {self._entity_path}: {e}"
-                ) from e
+                except Exception as e:
+                    if isinstance(e, BibliofabricError):
+                        raise
+                    logger.exception(
+                        f"Failed during iteration of {self._entity_path} with params {current_params}"
+                    )
+                    raise BibliofabricError(
+                        f"Unexpected error during iteration of {self._entity_path}: {e}"
+                    ) from e
+        finally:
+            # Don't leave a prefetched request running if the caller stops early
+            if pending is not None:
+                if pending.done():
+                    if not pending.cancelled():
+                        # Retrieve a failed prefetch so asyncio doesn't log it
+                        pending.exception()
+                else:
+                    pending.cancel()
+                    try:
+                        await pending
+                    except asyncio.CancelledError:
+                        # Only swallow the prefetch's own cancellation
+                        if not pending.cancelled():
+                            raise
+                    except Exception as e:
+                        # The caller never asked for this page, so don't raise
+                        logger.debug(f"Discarded failed prefetch: {e}")
 
 
 class PageIterableMixin:
@@ -617,16 +741,25 @@ class PageIterableMixin:
         sort_by: str | None = None,
         filters: BaseModel | dict[str, Any] | None = None,
         search: str | None = None,
+        *,
+        concurrency: int = 1,
     ) -> AsyncIterator[Any]:
         """Iterate through all entities matching the criteria using page-based pagination.
 
         This method automatically handles pagination by incrementing the page number
         to fetch successive pages of results. It yields individual entities.
 
+        When ``concurrency`` is greater than 1 and the API reports a total result
+        count, the remaining pages are fetched in windows of ``concurrency``
+        concurrent requests once the first page has been received. Entities are
+        still yielded in page order.
+
         Args:
             page_size: Number of results to fetch per API call during iteration.
             sort_by: Field to sort by.
             filters: Filter criteria as a Pydantic model or dictionary.
+            concurrency: Maximum number of page requests in flight at once.
+                Defaults to 1 (sequential fetching).
 
         Yields:
             Any: Individual entities, either as parsed Pydantic models (if
@@ -634,11 +767,14 @@ class PageIterableMixin:
 
         Raises:
             BibliofabricError: If the API request fails during iteration.
+            ValidationError: If ``concurrency`` is less than 1.
         """
         if not self._entity_path:
             raise BibliofabricError(
                 f"{self.__class__.__name__} must define _entity_path"
             )
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
 
         # Convert filters to dictionary if it's a Pydantic model
         params = self._serialize_filters(filters)
@@ -647,66 +783,95 @@ class PageIterableMixin:
             params[self._param_sort] = self._normalize_sort(sort_by)
         if search is not None and self._param_search:
             params[self._param_search] = search
+        params[self._param_page_size] = page_size
 
         logger.debug(
             f"Iterating {self._entity_path} (page-based): pageSize={page_size}, "
-            f"sort='{sort_by}', filters={params}"
+            f"sort='{sort_by}', filters={params}, concurrency={concurrency}"
         )
 
+        async def fetch_page(page: int) -> Any:
+            page_params = {**params, self._param_page: page}
+            logger.debug(
+                f"Iterating {self._entity_path} page {page} with params: {page_params}"
+            )
+            response = await self._api_client.request(
+                "GET",
+                self._entity_path,
+                params=page_params,
+                base_url_override=self._base_url_override,
+            )
+            return response.json()
+
+        # Resolve per-page lookups once rather than on every page and entity
+        unwrapper = self.response_unwrapper
+        entity_model = self._entity_model
+
         current_page = 1
+        last_page: int | None = None
 
         while True:
             try:
-                params[self._param_page] = current_page
-                params[self._param_page_size] = page_size
-
-                logger.debug(
-                    f"Iterating {self._entity_path} page {current_page} with params: {params}"
-                )
-
-                response = await self._api_client.request(
-                    "GET",
-                    self._entity_path,
-                    params=params.copy(),
-                    base_url_override=self._base_url_override,
-                )
-
-                response_data = response.json()
-
-                # Use the response unwrapper to get results
-                results = self.response_unwrapper.unwrap_results(response_data)
-
-                if not results:
+                if concurrency > 1 and last_page is not None:
+                    window = range(
+                        current_page, min(current_page + concurrency, last_page + 1)
+                    )
                     logger.debug(
-                        f"No more results for {self._entity_path} at page {current_page}, stopping iteration."
+                        f"Prefetching {self._entity_path} pages "
+                        f"{window.start}-{window.stop - 1} concurrently"
                     )
-                    break
+                    pages = await asyncio.gather(
+                        *(fetch_page(page) for page in window),
+                        return_exceptions=True,
+                    )
+                else:
+                    pages = [await fetch_page(current_page)]
+
+                for response_data in pages:
+                    if isinstance(response_data, BaseException):
+                        raise response_data
+
+                    # Use the response unwrapper to get results
+                    results = unwrapper.unwrap_results(response_data)
 
-                # Yield each result
-                for result_data in results:
-                    if self._entity_model:
-                        try:
-                            yield self._entity_model.model_validate(result_data)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to parse entity data with {self._entity_model.__name__}: {e}. "
-                                "Yielding raw data."
-                            )
+                    if not results:
+                        logger.debug(
+                            f"No more results for {self._entity_path} at page {current_page}, stopping iteration."
+                        )
+                        return
+
+                    # Yield each result
+                    for result_data in results:
+                        if entity_model:
+                            try:
+                                yield entity_model.model_validate(result_data)
+                            except Exception as e:
+                                logger.warning(
+                                    f"Failed to parse entity data with {entity_model.__name__}: {e}. "
+                                    "Yielding raw data."
+                                )
+                                yield result_data
+                        else:
                             yield result_data
-                    else:
-                        yield result_data
 
-                # Check if there are more pages
-                total = self.response_unwrapper.get_total_results(response_data)
-                if total is not None:
-                    fetched = current_page * page_size
-                    if fetched >= total:
+                    if self._stop_on_short_page and len(results) < page_size:
                         logger.debug(
-                            f"Fetched all {total} results for {self._entity_path}, stopping iteration."
+                            f"Short page {current_page} for {self._entity_path}, stopping iteration."
                         )
-                        break
+                        return
+
+                    # Check if there are more pages; the total is read only until known
+                    if last_page is None:
+                        total = unwrapper.get_total_results(response_data)
+                        if total is not None:
+                            last_page = -(-total // page_size)
+                    if last_page is not None and current_page >= last_page:
+                        logger.debug(
+                            f"Fetched all {last_page} pages for {self._entity_path}, stopping iteration."
+                        )
+                        return
 
-                current_page += 1
+                    current_page += 1
 
             except Exception as e:
                 if isinstance(e, BibliofabricError):
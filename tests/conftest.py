@@ -0,0 +1,41 @@
+"""Shared fixtures for the bibliofabric test suite."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from bibliofabric.client import BaseApiClient
+from bibliofabric.models import ResponseUnwrapper
+
+
+@pytest.fixture
+def mock_unwrapper():
+    """Fixture for a mock ResponseUnwrapper."""
+    return MagicMock(spec=ResponseUnwrapper)
+
+
+@pytest.fixture
+def mock_api_client(mock_unwrapper):
+    """Fixture for a mock BaseApiClient wired to the mock unwrapper."""
+    client = AsyncMock(spec=BaseApiClient)
+    client._response_unwrapper = mock_unwrapper
+    return client
+
+
+@pytest.fixture
+def empty_page_json():
+    """Fixture for the JSON payload of a page with no results."""
+    return {"results": []}
+
+
+@pytest.fixture
+def mock_pages(mock_api_client):
+    """Fixture that queues one 200 response per JSON payload on the mock client."""
+
+    def _queue(payloads):
+        mock_api_client.request.side_effect = [
+            httpx.Response(200, json=payload) for payload in payloads
+        ]
+
+    return _queue
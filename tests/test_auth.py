@@ -13,6 +13,9 @@ from bibliofabric.auth import (
 )
 from bibliofabric.exceptions import AuthError, ConfigurationError
 
+# Attached to canned token-endpoint responses and errors; never sent or mutated
+TOKEN_REQUEST = httpx.Request("POST", "http://token.com")
+
 
 @pytest.mark.asyncio
 async def test_no_auth_authenticate():
@@ -108,7 +111,7 @@ async def test_client_credentials_auth_fetch_token_success(mock_post, MockBasicA
     mock_post.return_value = httpx.Response(
         200,
         json={"access_token": "new_token", "expires_in": 3600},
-        request=httpx.Request("POST", "http://token.com"),
+        request=TOKEN_REQUEST,
     )
 
     auth = ClientCredentialsAuth(
@@ -135,7 +138,7 @@ async def test_client_credentials_auth_fetch_token_no_access_token_in_response(
     mock_post.return_value = httpx.Response(
         200,
         json={"expires_in": 3600},
-        request=httpx.Request("POST", "http://token.com"),
+        request=TOKEN_REQUEST,
     )
 
     auth = ClientCredentialsAuth(
@@ -151,7 +154,7 @@ async def test_client_credentials_auth_fetch_token_http_error(mock_post):
     """Test ClientCredentialsAuth raises AuthError on HTTP status error."""
     mock_post.side_effect = httpx.HTTPStatusError(
         "Bad Request",
-        request=httpx.Request("POST", "http://token.com"),
+        request=TOKEN_REQUEST,
         response=httpx.Response(400),
     )
 
@@ -167,7 +170,7 @@ async def test_client_credentials_auth_fetch_token_http_error(mock_post):
 async def test_client_credentials_auth_fetch_token_network_error(mock_post):
     """Test ClientCredentialsAuth raises AuthError on network error."""
     mock_post.side_effect = httpx.RequestError(
-        "Network unreachable", request=httpx.Request("POST", "http://token.com")
+        "Network unreachable", request=TOKEN_REQUEST
     )
 
     auth = ClientCredentialsAuth(
@@ -186,7 +189,7 @@ async def test_client_credentials_auth_authenticate_fetches_token(mock_post):
     mock_post.return_value = httpx.Response(
         200,
         json={"access_token": "new_token"},
-        request=httpx.Request("POST", "http://token.com"),
+        request=TOKEN_REQUEST,
     )
 
     auth = ClientCredentialsAuth(
@@ -252,7 +255,7 @@ async def test_client_credentials_auth_token_refetched_when_expired(mock_post):
     mock_post.return_value = httpx.Response(
         200,
         json={"access_token": "refreshed_token", "expires_in": 3600},
-        request=httpx.Request("POST", "http://token.com"),
+        request=TOKEN_REQUEST,
     )
 
     auth = ClientCredentialsAuth(
@@ -1,5 +1,8 @@
 """Tests for the BaseApiClient in bibliofabric."""
 
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
@@ -12,12 +15,6 @@ from bibliofabric.exceptions import APIError, TimeoutError
 from bibliofabric.models import ResponseUnwrapper
 
 
-@pytest.fixture
-def mock_unwrapper():
-    """Fixture for a mock ResponseUnwrapper."""
-    return MagicMock(spec=ResponseUnwrapper)
-
-
 @pytest.fixture
 def mock_settings():
     """Fixture for mock BaseApiSettings."""
@@ -574,6 +571,129 @@ async def test_aclose_does_not_close_external_http_client():
     await external_client.aclose()  # Clean up external client
 
 
+@pytest.mark.asyncio
+async def test_shared_http_client_reused_across_instances(mock_unwrapper):
+    """Instances created with share_http_client=True reuse one HTTP client."""
+
+    class SharedClient(BaseApiClient):
+        pass
+
+    settings = BaseApiSettings()
+    async with SharedClient(
+        base_url="http://example.com",
+        settings=settings,
+        response_unwrapper=mock_unwrapper,
+        share_http_client=True,
+    ) as first:
+        pass
+    second = SharedClient(
+        base_url="http://example.com",
+        settings=settings,
+        response_unwrapper=mock_unwrapper,
+        share_http_client=True,
+    )
+
+    assert second._http_client is first._http_client
+    assert not first._http_client.is_closed  # aclose() leaves it open
+    assert "_shared_http_clients" not in BaseApiClient.__dict__  # not leaked
+
+    await SharedClient.aclose_shared_http_client()
+    assert second._http_client.is_closed
+
+    third = SharedClient(
+        base_url="http://example.com",
+        settings=settings,
+        response_unwrapper=mock_unwrapper,
+        share_http_client=True,
+    )
+    assert third._http_client is not second._http_client  # recreated after close
+    await SharedClient.aclose_shared_http_client()
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_keyed_by_settings(mock_unwrapper):
+    """Instances whose client settings differ do not share an HTTP client."""
+
+    class SharedClient(BaseApiClient):
+        pass
+
+    def make(settings):
+        return SharedClient(
+            base_url="http://example.com",
+            settings=settings,
+            response_unwrapper=mock_unwrapper,
+            share_http_client=True,
+        )
+
+    default = make(BaseApiSettings())
+    same = make(BaseApiSettings())
+    slow = make(BaseApiSettings(request_timeout=120.0))
+    renamed = make(BaseApiSettings(user_agent="other-agent/1.0"))
+
+    assert same._http_client is default._http_client
+    assert slow._http_client is not default._http_client
+    assert slow._http_client.timeout.read == 120.0  # noqa: PLR2004
+    assert renamed._http_client is not default._http_client
+    assert renamed._http_client.headers["User-Agent"] == "other-agent/1.0"
+
+    await SharedClient.aclose_shared_http_client()
+    assert default._http_client.is_closed
+    assert slow._http_client.is_closed
+    assert renamed._http_client.is_closed
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small JSON body over a persistent connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def keep_alive_server():
+    """Local HTTP/1.1 server that keeps connections open between requests."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_shared_http_client_survives_separate_event_loops(
+    mock_unwrapper, keep_alive_server
+):
+    """Each event loop gets its own shared client, so pooled connections never cross loops."""
+
+    class SharedClient(BaseApiClient):
+        pass
+
+    settings = BaseApiSettings(max_retries=0)
+
+    async def run_once():
+        async with SharedClient(
+            base_url=keep_alive_server,
+            settings=settings,
+            response_unwrapper=mock_unwrapper,
+            share_http_client=True,
+        ) as client:
+            response = await client.request("GET", "/ping")
+        # Sessions close, but the shared client is deliberately left open
+        return response.status_code
+
+    assert [asyncio.run(run_once()) for _ in range(2)] == [200, 200]
+
+
 @pytest.mark.asyncio
 async def test_client_as_context_manager(mock_unwrapper):
     """Test BaseApiClient as an asynchronous context manager."""
@@ -1,5 +1,6 @@
 """Additional tests for client.py to cover error paths, caching, rate limiting, and hooks."""
 
+import asyncio
 from datetime import UTC, datetime as dt
 from email.utils import formatdate
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -19,11 +20,11 @@ from bibliofabric.exceptions import (
     RateLimitError,
     TimeoutError,
 )
-from bibliofabric.models import ResponseUnwrapper
 from bibliofabric.types import RequestData
 
 # Constants for readability
 HTTP_STATUS_OK = 200
+HTTP_STATUS_NOT_MODIFIED = 304
 HTTP_STATUS_BAD_REQUEST = 400
 HTTP_STATUS_TOO_MANY = 429
 HTTP_STATUS_SERVICE_UNAVAILABLE = 503
@@ -37,6 +38,9 @@ EXPECTED_RETRY_AFTER = 30.0
 EXPECTED_REMAINING = 50
 EXPECTED_RESET_TIMESTAMP = 1700000000.0
 
+# Attached to hand-built responses only; never sent or mutated
+TEST_REQUEST = httpx.Request("GET", "https://api.example.com/test")
+
 
 # --- Shared fixtures ---
 
@@ -45,11 +49,6 @@ class SimpleModel(BaseModel):
     data: str
 
 
-@pytest.fixture
-def mock_unwrapper():
-    return MagicMock(spec=ResponseUnwrapper)
-
-
 @pytest.fixture
 def mock_settings():
     return BaseApiSettings(
@@ -94,6 +93,30 @@ async def test_ssl_context_fallback_on_certifi_error(mock_unwrapper, mock_settin
         await client.aclose()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("h2_spec", "expected_http2"), [(object(), True), (None, False)]
+)
+async def test_http2_setting(mock_unwrapper, mock_settings, h2_spec, expected_http2):
+    """http2=True is passed to httpx only when the h2 package is available."""
+    mock_settings.http2 = True
+    mock_http_client = AsyncMock()
+    mock_http_client.is_closed = False
+    with (
+        patch("bibliofabric.client.importlib.util.find_spec", return_value=h2_spec),
+        patch(
+            "bibliofabric.client.httpx.AsyncClient", return_value=mock_http_client
+        ) as mock_cls,
+    ):
+        client = BaseApiClient(
+            settings=mock_settings,
+            response_unwrapper=mock_unwrapper,
+            base_url="https://api.example.com",
+        )
+        assert mock_cls.call_args.kwargs["http2"] is expected_http2
+        await client.aclose()
+
+
 # --- Rate limit header parsing (lines 186-246) ---
 
 
@@ -108,7 +131,7 @@ async def test_parse_rate_limit_headers_all_headers(base_client):
             "X-RateLimit-Reset": "1700000000",
             "Retry-After": "30",
         },
-        request=httpx.Request("GET", "https://api.example.com/test"),
+        request=TEST_REQUEST,
     )
     result = await base_client._parse_rate_limit_headers(response)
     assert result == EXPECTED_RETRY_AFTER
@@ -129,7 +152,7 @@ async def test_parse_rate_limit_headers_retry_after_http_date(base_client):
     response = httpx.Response(
         HTTP_STATUS_OK,
         headers={"Retry-After": http_date},
-        request=httpx.Request("GET", "https://api.example.com/test"),
+        request=TEST_REQUEST,
     )
     result = await base_client._parse_rate_limit_headers(response)
     assert result is not None
@@ -142,7 +165,7 @@ async def test_parse_rate_limit_headers_retry_after_invalid_date(base_client):
     response = httpx.Response(
         HTTP_STATUS_OK,
         headers={"Retry-After": "not-a-valid-date"},
-        request=httpx.Request("GET", "https://api.example.com/test"),
+        request=TEST_REQUEST,
     )
     result = await base_client._parse_rate_limit_headers(response)
     assert result is None
@@ -154,7 +177,7 @@ async def test_parse_rate_limit_headers_reset_http_date(base_client):
     response = httpx.Response(
         HTTP_STATUS_OK,
         headers={"X-RateLimit-Reset": "Wed, 01 Jan 2030 00:00:00 GMT"},
-        request=httpx.Request("GET", "https://api.example.com/test"),
+        request=TEST_REQUEST,
     )
     await base_client._parse_rate_limit_headers(response)
     assert base_client._rate_limit_reset_timestamp is not None
@@ -166,7 +189,7 @@ async def test_parse_rate_limit_headers_reset_invalid_date(base_client):
     response = httpx.Response(
         HTTP_STATUS_OK,
         headers={"X-RateLimit-Reset": "not-a-date"},
-        request=httpx.Request("GET", "https://api.example.com/test"),
+        request=TEST_REQUEST,
     )
     await base_client._parse_rate_limit_headers(response)
     assert base_client._rate_limit_reset_timestamp is None
@@ -182,7 +205,7 @@ async def test_parse_rate_limit_headers_non_digit_values(base_client):
             "X-RateLimit-Remaining": "also-not",
             "X-RateLimit-Reset": "nope",
         },
-        request=httpx.Request("GET", "https://api.example.com/test"),
+        request=TEST_REQUEST,
     )
     result = await base_client._parse_rate_limit_headers(response)
     assert result is None
@@ -508,7 +531,7 @@ def test_generate_cache_key_without_params(base_client):
 
 @pytest.mark.asyncio
 async def test_cache_hit_type_mismatch_discards_entry(base_client, httpx_mock):
-    """Test that a cache hit with type mismatch is discarded (lines 706-710)."""
+    """Test that a cache hit with type mismatch is treated as a miss and refetched."""
     cache_key = base_client._generate_cache_key("GET", "https://api.example.com/test")
     base_client._cache[cache_key] = {"wrong": "type"}
 
@@ -578,6 +601,116 @@ async def test_request_cache_miss_then_store_and_hit(base_client, httpx_mock):
     assert len(httpx_mock.get_requests()) == EXPECTED_SINGLE_REQUEST
 
 
+@pytest.mark.asyncio
+async def test_request_raw_response_cached_without_model(
+    base_client, mock_settings, httpx_mock
+):
+    """With cache_raw_responses, GET requests without expected_model reuse the response."""
+    mock_settings.cache_raw_responses = True
+    httpx_mock.add_response(json={"data": "first"}, status_code=HTTP_STATUS_OK)
+
+    r1 = await base_client.request("GET", "/raw", params={"page": 1})
+    r2 = await base_client.request("GET", "/raw", params={"page": 1})
+
+    assert isinstance(r1, httpx.Response)
+    assert r2 is r1
+    assert r2.json() == {"data": "first"}
+    assert len(httpx_mock.get_requests()) == EXPECTED_SINGLE_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_raw_response_not_cached_by_default(base_client, httpx_mock):
+    """Without cache_raw_responses, raw GET responses (e.g. page crawls) skip the cache."""
+    httpx_mock.add_response(json={"data": "first"}, status_code=HTTP_STATUS_OK)
+    httpx_mock.add_response(json={"data": "second"}, status_code=HTTP_STATUS_OK)
+
+    r1 = await base_client.request("GET", "/raw", params={"page": 1})
+    r2 = await base_client.request("GET", "/raw", params={"page": 1})
+
+    assert r1.json() == {"data": "first"}
+    assert r2.json() == {"data": "second"}
+    assert len(base_client._cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_model_not_returned_for_raw_request(
+    base_client, mock_settings, httpx_mock
+):
+    """A cached parsed model is not returned when the caller expects a raw response."""
+    mock_settings.cache_raw_responses = True
+    cache_key = base_client._generate_cache_key("GET", "https://api.example.com/test")
+    base_client._cache[cache_key] = SimpleModel(data="cached")
+    httpx_mock.add_response(json={"data": "fresh"}, status_code=HTTP_STATUS_OK)
+
+    result = await base_client.request("GET", "/test")
+
+    assert isinstance(result, httpx.Response)
+    assert result.json() == {"data": "fresh"}
+    assert base_client._cache[cache_key] is result
+
+
+@pytest.mark.asyncio
+async def test_raw_request_leaves_cached_model_alone(base_client, httpx_mock):
+    """Without cache_raw_responses, a raw GET neither reads nor evicts cached models."""
+    httpx_mock.add_response(json={"data": "model"}, status_code=HTTP_STATUS_OK)
+    httpx_mock.add_response(json={"data": "raw"}, status_code=HTTP_STATUS_OK)
+
+    first = await base_client.request("GET", "/test", expected_model=SimpleModel)
+    raw = await base_client.request("GET", "/test")
+    second = await base_client.request("GET", "/test", expected_model=SimpleModel)
+
+    assert isinstance(raw, httpx.Response)
+    assert second is first
+    assert len(httpx_mock.get_requests()) == EXPECTED_TWO_REQUESTS
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_entry_revalidated_with_etag(
+    mock_unwrapper, mock_settings, httpx_mock
+):
+    """Expired entries are revalidated and reused on 304 Not Modified."""
+    mock_settings.enable_conditional_requests = True
+    client = BaseApiClient(
+        settings=mock_settings,
+        response_unwrapper=mock_unwrapper,
+        base_url="https://api.example.com",
+    )
+    httpx_mock.add_response(
+        json={"data": "first"},
+        status_code=HTTP_STATUS_OK,
+        headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+    httpx_mock.add_response(status_code=HTTP_STATUS_NOT_MODIFIED)
+
+    r1 = await client.request("GET", "/test", expected_model=SimpleModel)
+    client._cache.clear()  # Simulate TTL expiry
+    r2 = await client.request("GET", "/test", expected_model=SimpleModel)
+
+    assert r2 is r1
+    first, revalidation = httpx_mock.get_requests()
+    assert "If-None-Match" not in first.headers
+    assert revalidation.headers["If-None-Match"] == '"v1"'
+    assert revalidation.headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    cache_key = client._generate_cache_key("GET", "https://api.example.com/test")
+    assert client._cache[cache_key] is r1
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_disabled_by_default(base_client, httpx_mock):
+    """Without enable_conditional_requests, expired entries are fetched in full."""
+    httpx_mock.add_response(
+        json={"data": "first"}, status_code=HTTP_STATUS_OK, headers={"ETag": '"v1"'}
+    )
+    httpx_mock.add_response(json={"data": "second"}, status_code=HTTP_STATUS_OK)
+
+    await base_client.request("GET", "/test", expected_model=SimpleModel)
+    base_client._cache.clear()
+    result = await base_client.request("GET", "/test", expected_model=SimpleModel)
+
+    assert result.data == "second"
+    assert "If-None-Match" not in httpx_mock.get_requests()[1].headers
+
+
 # --- Non-GET requests don't use cache ---
 
 
@@ -611,7 +744,7 @@ async def test_parse_rate_limit_headers_retry_after_naive_http_date(base_client)
         response = httpx.Response(
             HTTP_STATUS_OK,
             headers={"Retry-After": "Sun, 01 Jun 2030 12:00:00"},
-            request=httpx.Request("GET", "https://api.example.com/test"),
+            request=TEST_REQUEST,
         )
         result = await base_client._parse_rate_limit_headers(response)
         assert result is not None
@@ -629,7 +762,7 @@ async def test_cache_store_parsed_model_type_mismatch(base_client):
             httpx.Response(
                 HTTP_STATUS_OK,
                 json={"data": "ok"},
-                request=httpx.Request("GET", "https://api.example.com/test"),
+                request=TEST_REQUEST,
             ),
             {"data": "not_a_model"},
             1,
@@ -638,3 +771,161 @@ async def test_cache_store_parsed_model_type_mismatch(base_client):
 
     result = await base_client.request("GET", "/test", expected_model=SimpleModel)
     assert isinstance(result, httpx.Response)
+
+
+# --- Request coalescing ---
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_are_coalesced(
+    mock_unwrapper, mock_settings, httpx_mock
+):
+    """Concurrent identical GETs share a single HTTP call when coalescing is on."""
+    mock_settings.enable_caching = False
+    mock_settings.coalesce_requests = True
+    client = BaseApiClient(
+        settings=mock_settings,
+        response_unwrapper=mock_unwrapper,
+        base_url="https://api.example.com",
+    )
+    httpx_mock.add_response(
+        url="https://api.example.com/test?page=1", json={"data": "shared"}
+    )
+    httpx_mock.add_response(
+        url="https://api.example.com/test?page=2", json={"data": "other"}
+    )
+
+    r1, r2, r3 = await asyncio.gather(
+        client.request("GET", "/test", params={"page": 1}, expected_model=SimpleModel),
+        client.request("GET", "/test", params={"page": 1}, expected_model=SimpleModel),
+        client.request("GET", "/test", params={"page": 2}, expected_model=SimpleModel),
+    )
+
+    assert r1 is r2
+    assert r1.data == "shared"
+    assert r3.data == "other"
+    assert len(httpx_mock.get_requests()) == EXPECTED_TWO_REQUESTS
+    assert client._inflight_requests == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_error_reaches_all_callers(
+    mock_unwrapper, mock_settings, httpx_mock
+):
+    """A failing shared request raises for every coalesced caller."""
+    mock_settings.max_retries = 0
+    mock_settings.coalesce_requests = True
+    client = BaseApiClient(
+        settings=mock_settings,
+        response_unwrapper=mock_unwrapper,
+        base_url="https://api.example.com",
+    )
+    httpx_mock.add_response(status_code=HTTP_STATUS_BAD_REQUEST)
+
+    results = await asyncio.gather(
+        client.request("GET", "/fail"),
+        client.request("GET", "/fail"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, APIError) for r in results)
+    assert len(httpx_mock.get_requests()) == EXPECTED_SINGLE_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_cancelled_with_last_caller(
+    mock_unwrapper, mock_settings
+):
+    """The shared request is cancelled once no caller is waiting on it."""
+    mock_settings.coalesce_requests = True
+    client = BaseApiClient(
+        settings=mock_settings,
+        response_unwrapper=mock_unwrapper,
+        base_url="https://api.example.com",
+    )
+    cancelled = asyncio.Event()
+
+    async def slow_request(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client._request_with_retry = slow_request
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.request("GET", "/slow"), timeout=0.05)
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert client._inflight_requests == {}
+    assert client._inflight_waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_not_joined_after_cancellation(
+    mock_unwrapper, mock_settings
+):
+    """A caller arriving as the last waiter leaves starts a fresh request."""
+    mock_settings.coalesce_requests = True
+    client = BaseApiClient(
+        settings=mock_settings,
+        response_unwrapper=mock_unwrapper,
+        base_url="https://api.example.com",
+    )
+    response = httpx.Response(HTTP_STATUS_OK, json={"data": "ok"}, request=TEST_REQUEST)
+    calls = 0
+
+    async def first_call_hangs(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(10)
+        return response, None, 1
+
+    client._request_with_retry = first_call_hangs
+
+    first = asyncio.create_task(client.request("GET", "/slow"))
+    while not client._inflight_waiters:
+        await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert await client.request("GET", "/slow") is response
+    assert calls == 2  # noqa: PLR2004
+    assert client._inflight_requests == {}
+    assert client._inflight_waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_survives_one_cancelled_caller(
+    mock_unwrapper, mock_settings
+):
+    """Cancelling one of several callers leaves the shared request running."""
+    mock_settings.coalesce_requests = True
+    client = BaseApiClient(
+        settings=mock_settings,
+        response_unwrapper=mock_unwrapper,
+        base_url="https://api.example.com",
+    )
+    response = httpx.Response(HTTP_STATUS_OK, json={"data": "ok"}, request=TEST_REQUEST)
+    release = asyncio.Event()
+
+    async def gated_request(**kwargs):
+        await release.wait()
+        return response, None, 1
+
+    client._request_with_retry = gated_request
+
+    first = asyncio.create_task(client.request("GET", "/slow"))
+    second = asyncio.create_task(client.request("GET", "/slow"))
+    while sum(client._inflight_waiters.values()) < 2:  # noqa: PLR2004
+        await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    assert await second is response
+    assert client._inflight_waiters == {}
@@ -1,9 +1,11 @@
 # tests/test_iter_helpers.py
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 from pydantic import BaseModel
 
+from bibliofabric.exceptions import AuthError, ValidationError
 from bibliofabric.resources import BaseResourceClient, SearchableMixin
 
 
@@ -23,18 +25,12 @@ class FakeResponse(BaseModel):
 
 
 @pytest.fixture
-def mock_api():
-    api = AsyncMock()
-    return api
-
-
-@pytest.fixture
-def client(mock_api):
-    return FakeClient(api_client=mock_api)
+def client(mock_api_client):
+    return FakeClient(api_client=mock_api_client)
 
 
 @pytest.mark.asyncio
-async def test_collect_with_iterate(client, mock_api):
+async def test_collect_with_iterate(client):
     """collect() should use iterate() if available."""
 
     # Add a mock iterate method
@@ -50,7 +46,7 @@ async def test_collect_with_iterate(client, mock_api):
 
 
 @pytest.mark.asyncio
-async def test_collect_with_search_fallback(client, mock_api):
+async def test_collect_with_search_fallback(client):
     """collect() should fall back to search() if iterate() unavailable."""
     resp = FakeResponse(header=FakeHeader(numFound=2), results=[{"id": 1}, {"id": 2}])
     client.search = AsyncMock(return_value=resp)
@@ -59,7 +55,7 @@ async def test_collect_with_search_fallback(client, mock_api):
 
 
 @pytest.mark.asyncio
-async def test_count(client, mock_api):
+async def test_count(client):
     """count() should return numFound from header."""
     resp = FakeResponse(header=FakeHeader(numFound=42), results=[])
     client.search = AsyncMock(return_value=resp)
@@ -68,7 +64,7 @@ async def test_count(client, mock_api):
 
 
 @pytest.mark.asyncio
-async def test_count_dict_response(client, mock_api):
+async def test_count_dict_response(client):
     """count() should handle raw dict response."""
     client.search = AsyncMock(return_value={"header": {"numFound": 99}, "results": []})
     total = await client.count()
@@ -76,7 +72,7 @@ async def test_count_dict_response(client, mock_api):
 
 
 @pytest.mark.asyncio
-async def test_count_no_numfound(client, mock_api):
+async def test_count_no_numfound(client):
     """count() returns 0 when numFound is missing."""
     client.search = AsyncMock(return_value=FakeResponse())
     total = await client.count()
@@ -84,7 +80,7 @@ async def test_count_no_numfound(client, mock_api):
 
 
 @pytest.mark.asyncio
-async def test_first(client, mock_api):
+async def test_first(client):
     """first() should return the first result or None."""
 
     async def fake_iterate(*, page_size=100, sort_by=None, filters=None):
@@ -98,7 +94,7 @@ async def test_first(client, mock_api):
 
 
 @pytest.mark.asyncio
-async def test_first_empty(client, mock_api):
+async def test_first_empty(client):
     """first() returns None when no results."""
 
     async def fake_iterate(*, page_size=100, sort_by=None, filters=None):
@@ -109,3 +105,77 @@ async def test_first_empty(client, mock_api):
 
     result = await client.first()
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_collect_many(client):
+    """collect_many() runs one bounded-concurrency query per filter set, in order."""
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def fake_iterate(*, page_size=100, sort_by=None, filters=None):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (5 - filters["pid"]))
+        in_flight -= 1
+        yield {"pid": filters["pid"], "n": 1}
+        yield {"pid": filters["pid"], "n": 2}
+
+    client.iterate = fake_iterate
+
+    results = await client.collect_many(
+        [{"pid": pid} for pid in range(1, 5)], limit=1, concurrency=2
+    )
+
+    assert results == [[{"pid": pid, "n": 1}] for pid in range(1, 5)]
+    assert peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_collect_many_invalid_concurrency(client):
+    """collect_many() rejects concurrency below 1."""
+    with pytest.raises(ValidationError, match="concurrency"):
+        await client.collect_many([{"pid": 1}], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_collect_many_deduplicates_filter_sets(client):
+    """Identical filter sets are queried once and each caller gets its own list."""
+    queried = []
+
+    async def fake_iterate(*, page_size=100, sort_by=None, filters=None):
+        queried.append(filters["pid"])
+        yield {"pid": filters["pid"]}
+
+    client.iterate = fake_iterate
+
+    results = await client.collect_many(
+        [{"pid": "a"}, {"pid": "b"}, {"pid": "a"}], concurrency=2
+    )
+
+    assert sorted(queried) == ["a", "b"]
+    assert results == [[{"pid": "a"}], [{"pid": "b"}], [{"pid": "a"}]]
+    assert results[0] is not results[2]
+
+
+@pytest.mark.asyncio
+async def test_collect_many_cancels_remaining_queries_on_error(client):
+    """Once one query fails, no further queries are started."""
+    started = []
+
+    async def fake_iterate(*, page_size=100, sort_by=None, filters=None):
+        started.append(filters["pid"])
+        if filters["pid"] == 0:
+            raise AuthError("unauthorized")
+        await asyncio.sleep(0.05)
+        yield {"pid": filters["pid"]}
+
+    client.iterate = fake_iterate
+
+    with pytest.raises(AuthError, match="unauthorized"):
+        await client.collect_many([{"pid": pid} for pid in range(10)], concurrency=2)
+    started_at_failure = list(started)
+    await asyncio.sleep(0.1)
+
+    assert started == started_at_failure == [0, 1]
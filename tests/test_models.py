@@ -25,8 +25,9 @@ class DummyUnwrapper(ResponseUnwrapper):
         return response_json.get("pagination", {}).get("total_count")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dummy_unwrapper() -> DummyUnwrapper:
+    # Stateless, so a single instance is shared by the whole module
     return DummyUnwrapper()
 
 
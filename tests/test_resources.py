@@ -1,11 +1,14 @@
 # tests/test_resources.py
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import gc
+from unittest.mock import patch
 
 import httpx
 import pytest
 from pydantic import BaseModel, Field
 
 from bibliofabric.client import BaseApiClient
+from bibliofabric.config import BaseApiSettings
 from bibliofabric.exceptions import BibliofabricError, ValidationError
 from bibliofabric.models import ResponseUnwrapper
 from bibliofabric.resources import (
@@ -29,24 +32,15 @@ class MockSearchResponseModel(BaseModel):
     total: int = Field(alias="numFound")  # Example alias
 
 
-@pytest.fixture
-def mock_api_client():
-    client = AsyncMock(spec=BaseApiClient)
-    client.request = AsyncMock()
-    client._settings = MagicMock()  # Mock settings if BaseApiClient accesses it
-    client._settings.cache_ttl = 300  # Example setting
-    client._settings.cache_maxsize = 128  # Example setting
-    return client
-
+# Items served over two pages in the page-based iteration tests, validated once
+PAGE_ITEMS = [
+    {"id": "1", "value": "A"},
+    {"id": "2", "value": "B"},
+    {"id": "3", "value": "C"},
+]
+PAGE_ENTITIES = [MockEntityModel.model_validate(item) for item in PAGE_ITEMS]
 
-@pytest.fixture
-def mock_unwrapper():
-    unwrapper = AsyncMock(spec=ResponseUnwrapper)
-    unwrapper.unwrap_results = MagicMock()
-    unwrapper.unwrap_single_item = MagicMock()
-    unwrapper.get_next_page_token = MagicMock()
-    unwrapper.get_total_results = MagicMock()
-    return unwrapper
+EMPTY_SEARCH_JSON = {"results": [], "numFound": 0}
 
 
 class ConcreteResourceClient(BaseResourceClient):
@@ -132,13 +126,13 @@ async def test_gettable_mixin_get_success(
     mock_raw_item = {"id": entity_id, "value": "Test Value"}
 
     # Mock the response from BaseApiClient.request
-    mock_response = MagicMock(
-        spec=httpx.Response
-    )  # Ensure it's a spec for httpx.Response
-    mock_response.json.return_value = {
-        "results": [mock_raw_item],
-        "header": {"numFound": 1},
-    }
+    mock_response = httpx.Response(
+        200,
+        json={
+            "results": [mock_raw_item],
+            "header": {"numFound": 1},
+        },
+    )
     mock_api_client.request.return_value = (
         mock_response  # Should return the response object directly
     )
@@ -167,11 +161,13 @@ async def test_gettable_mixin_get_not_found(
     gettable_client, mock_api_client, mock_unwrapper
 ):
     entity_id = "notfound"
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {
-        "results": [],
-        "header": {"numFound": 0},
-    }  # Empty results
+    mock_response = httpx.Response(
+        200,
+        json={
+            "results": [],
+            "header": {"numFound": 0},
+        },  # Empty results
+    )
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = []
 
@@ -189,8 +185,7 @@ async def test_gettable_mixin_get_no_entity_model(
     mock_raw_item = {"id": entity_id, "value": "Raw Value"}
     gettable_client._entity_model = None  # type: ignore[assignment]
 
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [mock_raw_item]}
+    mock_response = httpx.Response(200, json={"results": [mock_raw_item]})
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = [mock_raw_item]
 
@@ -206,8 +201,7 @@ async def test_gettable_mixin_get_parsing_error(
     # Data that will cause a Pydantic validation error (e.g., missing 'value')
     mock_raw_item_invalid = {"id": entity_id}
 
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [mock_raw_item_invalid]}
+    mock_response = httpx.Response(200, json={"results": [mock_raw_item_invalid]})
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = [mock_raw_item_invalid]
 
@@ -226,8 +220,7 @@ async def test_searchable_mixin_search_success(
     mock_raw_results = [{"id": "1", "value": "A"}, {"id": "2", "value": "B"}]
     mock_response_json = {"results": mock_raw_results, "numFound": 2}
 
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_response_json
+    mock_response = httpx.Response(200, json=mock_response_json)
     mock_api_client.request.return_value = mock_response  # response
 
     filters = {"custom_filter": "test"}
@@ -260,8 +253,7 @@ async def test_searchable_mixin_search_no_search_model(
     searchable_client._search_response_model = None  # type: ignore[assignment]
     mock_raw_response_json = {"results": [{"id": "1", "value": "A"}]}
 
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_raw_response_json
+    mock_response = httpx.Response(200, json=mock_raw_response_json)
     mock_api_client.request.return_value = mock_response
 
     result = await searchable_client.search()
@@ -275,8 +267,7 @@ async def test_searchable_mixin_search_parsing_error(
     # Response that will fail MockSearchResponseModel validation (e.g. 'results' is not a list)
     mock_invalid_response_json = {"results": "not_a_list", "numFound": 0}
 
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_invalid_response_json
+    mock_response = httpx.Response(200, json=mock_invalid_response_json)
     mock_api_client.request.return_value = mock_response
 
     # Should log warning and return raw data
@@ -289,7 +280,7 @@ async def test_searchable_mixin_search_parsing_error(
 
 @pytest.mark.asyncio
 async def test_cursor_iterable_mixin_iterate_success(
-    cursor_iterable_client, mock_api_client, mock_unwrapper
+    cursor_iterable_client, mock_api_client, mock_unwrapper, mock_pages
 ):
     page1_items = [{"id": "1", "value": "Val1"}]
     page2_items = [{"id": "2", "value": "Val2"}]
@@ -298,12 +289,7 @@ async def test_cursor_iterable_mixin_iterate_success(
     response1_json = {"results": page1_items, "header": {"nextCursor": "cursor2"}}
     response2_json = {"results": page2_items, "header": {"nextCursor": None}}
 
-    mock_response1 = MagicMock(spec=httpx.Response)
-    mock_response1.json.return_value = response1_json
-    mock_response2 = MagicMock(spec=httpx.Response)
-    mock_response2.json.return_value = response2_json
-
-    mock_api_client.request.side_effect = [mock_response1, mock_response2]
+    mock_pages([response1_json, response2_json])
 
     # Mock unwrapper behavior
     mock_unwrapper.unwrap_results.side_effect = [page1_items, page2_items]
@@ -350,8 +336,7 @@ async def test_cursor_iterable_mixin_iterate_no_entity_model(
     page1_items_raw = [{"id": "raw1", "value": "RawVal1"}]
 
     response1_json = {"results": page1_items_raw, "header": {"nextCursor": None}}
-    mock_response1 = MagicMock(spec=httpx.Response)
-    mock_response1.json.return_value = response1_json
+    mock_response1 = httpx.Response(200, json=response1_json)
     mock_api_client.request.return_value = mock_response1
 
     mock_unwrapper.unwrap_results.return_value = page1_items_raw
@@ -371,8 +356,7 @@ async def test_cursor_iterable_mixin_iterate_parsing_error(
     page1_items_invalid = [{"id": "invalid_item"}]
 
     response1_json = {"results": page1_items_invalid, "header": {"nextCursor": None}}
-    mock_response1 = MagicMock(spec=httpx.Response)
-    mock_response1.json.return_value = response1_json
+    mock_response1 = httpx.Response(200, json=response1_json)
     mock_api_client.request.return_value = mock_response1
 
     mock_unwrapper.unwrap_results.return_value = page1_items_invalid
@@ -386,11 +370,9 @@ async def test_cursor_iterable_mixin_iterate_parsing_error(
 
 @pytest.mark.asyncio
 async def test_cursor_iterable_mixin_iterate_empty_initial_results(
-    cursor_iterable_client, mock_api_client, mock_unwrapper
+    cursor_iterable_client, mock_api_client, mock_unwrapper, empty_page_json
 ):
-    response_json = {"results": [], "header": {"nextCursor": None}}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = response_json
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request.return_value = mock_response
 
     mock_unwrapper.unwrap_results.return_value = []
@@ -401,7 +383,150 @@ async def test_cursor_iterable_mixin_iterate_empty_initial_results(
     assert len(results) == 0
     mock_api_client.request.assert_awaited_once()  # Should make one call
     mock_unwrapper.unwrap_results.assert_called_once()
-    mock_unwrapper.get_next_page_token.assert_called_once()  # Still checks for next token
+    # An empty page ends iteration without reading the next cursor
+    mock_unwrapper.get_next_page_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cursor_iterable_mixin_drops_page_param(
+    cursor_iterable_client, mock_api_client, mock_unwrapper, mock_pages
+):
+    """A stray page filter is dropped, and each page gets its own params dict."""
+    mock_pages([{"results": [{"id": str(page), "value": "V"}]} for page in (1, 2)])
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_next_page_token.side_effect = ["cursor2", None]
+
+    [_ async for _ in cursor_iterable_client.iterate(filters={"page": 3})]
+
+    first, second = (
+        c.kwargs["params"] for c in mock_api_client.request.await_args_list
+    )
+    assert first == {"cursor": "*", "pageSize": 100}
+    assert second == {"cursor": "cursor2", "pageSize": 100}
+    assert first is not second
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("prefetch", "expected_requests"), [(False, 1), (True, 2)])
+async def test_cursor_iterable_mixin_prefetch(
+    cursor_iterable_client,
+    mock_api_client,
+    mock_unwrapper,
+    prefetch,
+    expected_requests,
+):
+    """With prefetch, the next page is requested before the current one is consumed."""
+
+    async def fake_request(method, path, params=None, base_url_override=None):
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"id": params["cursor"], "value": "V"}],
+                "next": None if params["cursor"] == "c2" else "c2",
+            },
+        )
+
+    mock_api_client.request.side_effect = fake_request
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_next_page_token.side_effect = lambda data: data["next"]
+
+    iterator = cursor_iterable_client.iterate(prefetch=prefetch)
+    first = await anext(iterator)
+    await asyncio.sleep(0)  # Let a prefetch task start
+    assert mock_api_client.request.await_count == expected_requests
+
+    rest = [item async for item in iterator]
+    assert [first.id] + [r.id for r in rest] == ["*", "c2"]
+    assert mock_api_client.request.await_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_cursor_iterable_mixin_prefetch_cancelled_on_close(
+    cursor_iterable_client, mock_api_client, mock_unwrapper
+):
+    """Closing the iterator early cancels an in-flight prefetched page and waits for it."""
+    cancelled = asyncio.Event()
+
+    async def fake_request(method, path, params=None, base_url_override=None):
+        if params["cursor"] == "c2":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(200, json={"results": [{"id": "1", "value": "V"}]})
+
+    mock_api_client.request.side_effect = fake_request
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_next_page_token.return_value = "c2"
+
+    iterator = cursor_iterable_client.iterate(prefetch=True)
+    await anext(iterator)
+    await asyncio.sleep(0)
+    await iterator.aclose()
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_cursor_iterable_mixin_failed_prefetch_retrieved_on_close(
+    cursor_iterable_client, mock_api_client, mock_unwrapper
+):
+    """Closing after a failed prefetch neither raises nor leaves an unretrieved error."""
+    prefetch_failed = asyncio.Event()
+
+    async def fake_request(method, path, params=None, base_url_override=None):
+        if params["cursor"] == "c2":
+            prefetch_failed.set()
+            raise ValueError("prefetch boom")
+        return httpx.Response(200, json={"results": [{"id": "1", "value": "V"}]})
+
+    mock_api_client.request.side_effect = fake_request
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_next_page_token.return_value = "c2"
+
+    iterator = cursor_iterable_client.iterate(prefetch=True)
+    await anext(iterator)
+    await asyncio.wait_for(prefetch_failed.wait(), timeout=1)
+    await asyncio.sleep(0)  # Let the prefetch task finish with its error
+
+    loop = asyncio.get_running_loop()
+    previous_handler = loop.get_exception_handler()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    try:
+        await iterator.aclose()
+        del iterator
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_cls", [CursorIterableTestClient, PageIterableTestClient]
+)
+async def test_iterate_validates_entities_lazily(
+    client_cls, mock_api_client, mock_unwrapper
+):
+    """Entities are validated as they are consumed; an early break skips the rest."""
+    page_items = [{"id": str(i), "value": "V"} for i in range(5)]
+    mock_response = httpx.Response(200, json={"results": page_items})
+    mock_api_client.request.return_value = mock_response
+    mock_unwrapper.unwrap_results.return_value = page_items
+    mock_unwrapper.get_next_page_token.return_value = None
+    mock_unwrapper.get_total_results.return_value = len(page_items)
+
+    client = client_cls(mock_api_client, mock_unwrapper)
+    with patch.object(
+        MockEntityModel, "model_validate", wraps=MockEntityModel.model_validate
+    ) as spy:
+        async for item in client.iterate(page_size=len(page_items)):
+            assert item.id == "0"
+            break
+
+    spy.assert_called_once_with(page_items[0])
 
 
 # --- _base_url_override Tests ---
@@ -412,9 +537,7 @@ async def test_searchable_mixin_base_url_override_passed(
     mock_api_client, mock_unwrapper
 ):
     """Test that _base_url_override is passed through to request()."""
-    mock_raw_response_json = {"results": [], "numFound": 0}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_raw_response_json
+    mock_response = httpx.Response(200, json=EMPTY_SEARCH_JSON)
     mock_api_client.request.return_value = mock_response
 
     client = SearchableTestClient(mock_api_client, mock_unwrapper)
@@ -432,9 +555,7 @@ async def test_searchable_mixin_base_url_override_default_none(
     mock_api_client, mock_unwrapper
 ):
     """Test that default _base_url_override=None is passed through to request()."""
-    mock_raw_response_json = {"results": [], "numFound": 0}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_raw_response_json
+    mock_response = httpx.Response(200, json=EMPTY_SEARCH_JSON)
     mock_api_client.request.return_value = mock_response
 
     client = SearchableTestClient(mock_api_client, mock_unwrapper)
@@ -462,9 +583,7 @@ async def test_validate_sort_field_raises_on_invalid(mock_api_client, mock_unwra
 @pytest.mark.asyncio
 async def test_validate_sort_field_default_allows_any(mock_api_client, mock_unwrapper):
     """Test that default _validate_sort_field (no-op) allows any sort field."""
-    mock_raw_response_json = {"results": [], "numFound": 0}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_raw_response_json
+    mock_response = httpx.Response(200, json=EMPTY_SEARCH_JSON)
     mock_api_client.request.return_value = mock_response
 
     client = SearchableTestClient(mock_api_client, mock_unwrapper)
@@ -472,7 +591,7 @@ async def test_validate_sort_field_default_allows_any(mock_api_client, mock_unwr
     # Default _validate_sort_field is a no-op, should not raise
     result = await client.search(sort_by="any_field asc")
 
-    assert result == mock_raw_response_json
+    assert result == EMPTY_SEARCH_JSON
 
 
 # --- _supports_direct_get Tests ---
@@ -483,8 +602,7 @@ async def test_gettable_mixin_direct_get_uses_path(mock_api_client, mock_unwrapp
     """Test that _supports_direct_get=True uses direct path GET /{path}/{id}."""
     entity_id = "123"
     mock_raw_item = {"id": entity_id, "value": "Direct Value"}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_raw_item
+    mock_response = httpx.Response(200, json=mock_raw_item)
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_single_item.return_value = mock_raw_item
 
@@ -508,8 +626,7 @@ async def test_gettable_mixin_default_uses_search_by_id(
     entity_id = "123"
     mock_raw_item = {"id": entity_id, "value": "Test Value"}
     mock_raw_response_json = {"results": [mock_raw_item], "numFound": 1}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = mock_raw_response_json
+    mock_response = httpx.Response(200, json=mock_raw_response_json)
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = [mock_raw_item]
 
@@ -527,44 +644,31 @@ async def test_gettable_mixin_default_uses_search_by_id(
 
 
 @pytest.mark.asyncio
-async def test_page_iterable_mixin_basic_iteration(mock_api_client, mock_unwrapper):
+async def test_page_iterable_mixin_basic_iteration(
+    mock_api_client, mock_unwrapper, mock_pages, empty_page_json
+):
     """Test that PageIterableMixin iterates pages 1, 2 and stops on empty page 3."""
-    page1_items = [{"id": "1", "value": "A"}, {"id": "2", "value": "B"}]
-    page2_items = [{"id": "3", "value": "C"}]
-
-    responses = []
-    for items in [page1_items, page2_items, []]:
-        resp = MagicMock(spec=httpx.Response)
-        resp.json.return_value = {"results": items}
-        responses.append(resp)
+    page1_items, page2_items = PAGE_ITEMS[:2], PAGE_ITEMS[2:]
 
-    mock_api_client.request.side_effect = responses
+    mock_pages([{"results": page1_items}, {"results": page2_items}, empty_page_json])
     mock_unwrapper.unwrap_results.side_effect = [page1_items, page2_items, []]
     mock_unwrapper.get_total_results.return_value = None  # No total info
 
     client = PageIterableTestClient(mock_api_client, mock_unwrapper)
     results = [item async for item in client.iterate()]
 
-    assert len(results) == 3
-    assert results[0].id == "1"
-    assert results[1].id == "2"
-    assert results[2].id == "3"
+    assert results == PAGE_ENTITIES
     assert mock_api_client.request.await_count == 3
 
 
 @pytest.mark.asyncio
-async def test_page_iterable_mixin_stops_on_total(mock_api_client, mock_unwrapper):
+async def test_page_iterable_mixin_stops_on_total(
+    mock_api_client, mock_unwrapper, mock_pages
+):
     """Test that PageIterableMixin stops early when total results are reached."""
-    page1_items = [{"id": "1", "value": "A"}, {"id": "2", "value": "B"}]
-    page2_items = [{"id": "3", "value": "C"}]
+    page1_items, page2_items = PAGE_ITEMS[:2], PAGE_ITEMS[2:]
 
-    responses = []
-    for items in [page1_items, page2_items]:
-        resp = MagicMock(spec=httpx.Response)
-        resp.json.return_value = {"results": items}
-        responses.append(resp)
-
-    mock_api_client.request.side_effect = responses
+    mock_pages([{"results": page1_items}, {"results": page2_items}])
     mock_unwrapper.unwrap_results.side_effect = [page1_items, page2_items]
     # Total is 3, page_size=2: after page 2 (fetched=4>=3), iteration stops
     mock_unwrapper.get_total_results.return_value = 3
@@ -572,16 +676,35 @@ async def test_page_iterable_mixin_stops_on_total(mock_api_client, mock_unwrappe
     client = PageIterableTestClient(mock_api_client, mock_unwrapper)
     results = [item async for item in client.iterate(page_size=2)]
 
-    assert len(results) == 3
+    assert results == PAGE_ENTITIES
     assert mock_api_client.request.await_count == 2  # Stopped after 2 pages
 
 
 @pytest.mark.asyncio
-async def test_page_iterable_mixin_base_url_override(mock_api_client, mock_unwrapper):
+async def test_page_iterable_mixin_stops_on_short_page(
+    mock_api_client, mock_unwrapper, mock_pages
+):
+    """With _stop_on_short_page, a page shorter than page_size ends iteration."""
+    page1_items, page2_items = PAGE_ITEMS[:2], PAGE_ITEMS[2:]
+
+    mock_pages([{"results": page1_items}, {"results": page2_items}])
+    mock_unwrapper.unwrap_results.side_effect = [page1_items, page2_items]
+    mock_unwrapper.get_total_results.return_value = None  # No total info
+
+    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
+    client._stop_on_short_page = True
+    results = [item async for item in client.iterate(page_size=2)]
+
+    assert results == PAGE_ENTITIES
+    assert mock_api_client.request.await_count == 2  # No trailing empty page
+
+
+@pytest.mark.asyncio
+async def test_page_iterable_mixin_base_url_override(
+    mock_api_client, mock_unwrapper, empty_page_json
+):
     """Test that _base_url_override is passed through in PageIterableMixin requests."""
-    response_json = {"results": []}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = response_json
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = []
 
@@ -596,6 +719,125 @@ async def test_page_iterable_mixin_base_url_override(mock_api_client, mock_unwra
     assert kwargs.get("base_url_override") == "https://custom.api.com/v2"
 
 
+@pytest.mark.asyncio
+async def test_page_iterable_mixin_concurrent_prefetch(mock_api_client, mock_unwrapper):
+    """With concurrency > 1, later pages are fetched concurrently but yielded in order."""
+    total = 5
+    pages = {p: [{"id": str(p), "value": f"V{p}"}] for p in range(1, total + 1)}
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def fake_request(method, path, params=None, base_url_override=None):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        # Finish later pages first to prove ordering does not depend on timing
+        await asyncio.sleep(0.01 * (total - params["page"]))
+        in_flight -= 1
+        return httpx.Response(200, json={"results": pages[params["page"]]})
+
+    mock_api_client.request.side_effect = fake_request
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_total_results.return_value = total
+
+    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
+    results = [item async for item in client.iterate(page_size=1, concurrency=3)]
+
+    assert [r.id for r in results] == ["1", "2", "3", "4", "5"]
+    assert mock_api_client.request.await_count == total
+    assert peak_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_page_iterable_mixin_reads_total_once(mock_api_client, mock_unwrapper):
+    """The total is read from the first page only and reused for later pages."""
+    total = 3
+
+    async def fake_request(method, path, params=None, base_url_override=None):
+        return httpx.Response(
+            200, json={"results": [{"id": str(params["page"]), "value": "V"}]}
+        )
+
+    mock_api_client.request.side_effect = fake_request
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_total_results.return_value = total
+
+    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
+    results = [item async for item in client.iterate(page_size=1)]
+
+    assert [r.id for r in results] == ["1", "2", "3"]
+    assert mock_api_client.request.await_count == total
+    mock_unwrapper.get_total_results.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_page_iterable_mixin_concurrent_error_raises(
+    mock_api_client, mock_unwrapper
+):
+    """A failing page in a concurrent window is raised after earlier pages are yielded."""
+
+    async def fake_request(method, path, params=None, base_url_override=None):
+        if params["page"] == 3:  # noqa: PLR2004
+            raise ValueError("boom")
+        return httpx.Response(
+            200, json={"results": [{"id": str(params["page"]), "value": "V"}]}
+        )
+
+    mock_api_client.request.side_effect = fake_request
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_total_results.return_value = 4
+
+    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
+    pages = client.iterate(page_size=1, concurrency=4)
+
+    # Pages before the failing one are still yielded in order
+    assert [(await anext(pages)).id for _ in range(2)] == ["1", "2"]
+    with pytest.raises(BibliofabricError, match="boom"):
+        await anext(pages)
+
+
+@pytest.mark.asyncio
+async def test_page_iterable_mixin_invalid_concurrency(mock_api_client, mock_unwrapper):
+    """concurrency below 1 is rejected before any request is made."""
+    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
+    with pytest.raises(ValidationError, match="concurrency"):
+        [_ async for _ in client.iterate(concurrency=0)]
+    mock_api_client.request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_cls", [CursorIterableTestClient, PageIterableTestClient]
+)
+async def test_iterate_serializes_filters_once(
+    client_cls, mock_api_client, mock_unwrapper, mock_pages
+):
+    """Filters are serialized once per iterate() call, not once per page."""
+
+    class PageFilters(BaseModel):
+        type: str | None = None
+
+    mock_pages([{"results": [{"id": str(page), "value": "V"}]} for page in (1, 2, 3)])
+    mock_unwrapper.unwrap_results.side_effect = lambda data: data["results"]
+    mock_unwrapper.get_next_page_token.side_effect = ["c2", "c3", None]
+    mock_unwrapper.get_total_results.return_value = 3
+
+    client = client_cls(mock_api_client, mock_unwrapper)
+    with patch.object(
+        client, "_serialize_filters", wraps=client._serialize_filters
+    ) as spy:
+        results = [
+            item
+            async for item in client.iterate(page_size=1, filters=PageFilters(type="a"))
+        ]
+
+    assert len(results) == 3
+    assert mock_api_client.request.await_count == 3
+    spy.assert_called_once()
+    for call in mock_api_client.request.await_args_list:
+        assert call.kwargs["params"]["type"] == "a"
+
+
 # --- Change 1: Configurable Parameter Names ---
 class OpenAlexStyleParams:
     """Mixin group with OpenAlex-style parameter names for testing overrides."""
@@ -633,8 +875,7 @@ class OpenAlexGetClient(OpenAlexStyleParams, GettableMixin, ConcreteResourceClie
 @pytest.mark.asyncio
 async def test_searchable_custom_param_names(mock_api_client, mock_unwrapper):
     """SearchableMixin uses custom _param_page_size and _param_sort when overridden."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [], "total": 0}
+    mock_response = httpx.Response(200, json={"results": [], "total": 0})
     mock_api_client.request.return_value = mock_response
     client = OpenAlexSearchClient(mock_api_client, mock_unwrapper)
     await client.search(page=2, page_size=50, sort_by="title asc")
@@ -651,8 +892,7 @@ async def test_searchable_custom_param_names(mock_api_client, mock_unwrapper):
 async def test_cursor_iterable_custom_param_names(mock_api_client, mock_unwrapper):
     """CursorIterableMixin uses custom _param_cursor and _param_page_size."""
     page1 = [{"id": "1", "value": "A"}]
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": page1}
+    mock_response = httpx.Response(200, json={"results": page1})
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = page1
     mock_unwrapper.get_next_page_token.return_value = None
@@ -668,10 +908,11 @@ async def test_cursor_iterable_custom_param_names(mock_api_client, mock_unwrappe
 
 
 @pytest.mark.asyncio
-async def test_page_iterable_custom_param_names(mock_api_client, mock_unwrapper):
+async def test_page_iterable_custom_param_names(
+    mock_api_client, mock_unwrapper, empty_page_json
+):
     """PageIterableMixin uses custom _param_page, _param_page_size, _param_sort."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": []}
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = []
     client = OpenAlexPageClient(mock_api_client, mock_unwrapper)
@@ -689,8 +930,7 @@ async def test_page_iterable_custom_param_names(mock_api_client, mock_unwrapper)
 async def test_gettable_custom_param_names(mock_api_client, mock_unwrapper):
     """GettableMixin.get() non-direct path uses custom _param_id and _param_page_size."""
     entity = {"id": "W123", "value": "test"}
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [entity]}
+    mock_response = httpx.Response(200, json={"results": [entity]})
     mock_api_client.request.return_value = mock_response
     mock_unwrapper.unwrap_results.return_value = [entity]
     client = OpenAlexGetClient(mock_api_client, mock_unwrapper)
@@ -705,8 +945,7 @@ async def test_gettable_custom_param_names(mock_api_client, mock_unwrapper):
 @pytest.mark.asyncio
 async def test_default_param_names_unchanged(mock_api_client, mock_unwrapper):
     """Default SearchableTestClient still uses original OpenAIRE param names."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [], "total": 0}
+    mock_response = httpx.Response(200, json={"results": [], "total": 0})
     mock_api_client.request.return_value = mock_response
     client = SearchableTestClient(mock_api_client, mock_unwrapper)
     await client.search(page=1, page_size=20, sort_by="relevance")
@@ -736,8 +975,7 @@ class OpenAlexFilterClient(SearchableMixin, ConcreteResourceClient):
 @pytest.mark.asyncio
 async def test_custom_serialize_filters(mock_api_client, mock_unwrapper):
     """Custom _serialize_filters produces OpenAlex-style filter string."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [], "meta": {"count": 0}}
+    mock_response = httpx.Response(200, json={"results": [], "meta": {"count": 0}})
     mock_api_client.request.return_value = mock_response
     client = OpenAlexFilterClient(mock_api_client, mock_unwrapper)
 
@@ -755,10 +993,11 @@ async def test_custom_serialize_filters(mock_api_client, mock_unwrapper):
 
 
 @pytest.mark.asyncio
-async def test_default_serialize_filters_unchanged(mock_api_client, mock_unwrapper):
+async def test_default_serialize_filters_unchanged(
+    mock_api_client, mock_unwrapper, empty_page_json
+):
     """Default _serialize_filters produces individual params (backward compat)."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": []}
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request.return_value = mock_response
     client = SearchableTestClient(mock_api_client, mock_unwrapper)
 
@@ -774,62 +1013,36 @@ async def test_default_serialize_filters_unchanged(mock_api_client, mock_unwrapp
 
 
 # --- Change 3: Optional search Parameter ---
-@pytest.mark.asyncio
-async def test_searchable_search_param(mock_api_client, mock_unwrapper):
-    """SearchableMixin.search() adds search param when provided."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [], "total": 0}
-    mock_api_client.request.return_value = mock_response
-    client = SearchableTestClient(mock_api_client, mock_unwrapper)
-    await client.search(search="machine learning")
-    call_kwargs = mock_api_client.request.await_args[1]
-    params = call_kwargs["params"]
-    assert params["search"] == "machine learning"
+async def _run_query(client, **kwargs):
+    """Run search() or a full iterate(), depending on the client's mixin."""
+    if isinstance(client, SearchableMixin):
+        await client.search(**kwargs)
+    else:
+        [_ async for _ in client.iterate(**kwargs)]
 
 
 @pytest.mark.asyncio
-async def test_searchable_search_param_omitted_when_none(
-    mock_api_client, mock_unwrapper
+@pytest.mark.parametrize(
+    "client_cls",
+    [SearchableTestClient, CursorIterableTestClient, PageIterableTestClient],
+)
+@pytest.mark.parametrize("search", ["machine learning", None])
+async def test_search_param(
+    client_cls, search, mock_api_client, mock_unwrapper, empty_page_json
 ):
-    """SearchableMixin.search() omits search param when None (default)."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [], "total": 0}
+    """search() and both iterate() mixins add the search param only when given."""
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request.return_value = mock_response
-    client = SearchableTestClient(mock_api_client, mock_unwrapper)
-    await client.search()
-    call_kwargs = mock_api_client.request.await_args[1]
-    params = call_kwargs["params"]
-    assert "search" not in params
+    mock_unwrapper.unwrap_results.return_value = []
+    client = client_cls(mock_api_client, mock_unwrapper)
 
+    await _run_query(client, search=search)
 
-@pytest.mark.asyncio
-async def test_cursor_iterable_search_param(mock_api_client, mock_unwrapper):
-    """CursorIterableMixin.iterate() adds search param when provided."""
-    page1 = [{"id": "1", "value": "A"}]
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": page1}
-    mock_api_client.request.return_value = mock_response
-    mock_unwrapper.unwrap_results.return_value = page1
-    mock_unwrapper.get_next_page_token.return_value = None
-    client = CursorIterableTestClient(mock_api_client, mock_unwrapper)
-    [_ async for _ in client.iterate(search="deep learning")]
-    call_kwargs = mock_api_client.request.await_args[1]
-    params = call_kwargs["params"]
-    assert params["search"] == "deep learning"
-
-
-@pytest.mark.asyncio
-async def test_page_iterable_search_param(mock_api_client, mock_unwrapper):
-    """PageIterableMixin.iterate() adds search param when provided."""
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": []}
-    mock_api_client.request.return_value = mock_response
-    mock_unwrapper.unwrap_results.return_value = []
-    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
-    [_ async for _ in client.iterate(search="quantum")]
-    call_kwargs = mock_api_client.request.await_args[1]
-    params = call_kwargs["params"]
-    assert params["search"] == "quantum"
+    params = mock_api_client.request.await_args[1]["params"]
+    if search is None:
+        assert "search" not in params
+    else:
+        assert params["search"] == search
 
 
 @pytest.mark.asyncio
@@ -841,8 +1054,7 @@ async def test_search_param_disabled_when_param_search_empty(
     class NoSearchClient(SearchableMixin, ConcreteResourceClient):
         _param_search = ""
 
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.json.return_value = {"results": [], "total": 0}
+    mock_response = httpx.Response(200, json={"results": [], "total": 0})
     mock_api_client.request.return_value = mock_response
     client = NoSearchClient(mock_api_client, mock_unwrapper)
     await client.search(search="ignored")
@@ -850,3 +1062,119 @@ async def test_search_param_disabled_when_param_search_empty(
     params = call_kwargs["params"]
     assert "search" not in params
     assert "ignored" not in str(params)
+
+
+# --- Full-stack tests through a real BaseApiClient ---
+
+
+class HeaderResultsUnwrapper:
+    """Unwrapper for the {"header": {...}, "results": [...]} payloads served below."""
+
+    def unwrap_results(self, response_json):
+        return response_json["results"]
+
+    def unwrap_single_item(self, response_json):
+        return response_json
+
+    def get_next_page_token(self, response_json):
+        return response_json["header"]["nextCursor"]
+
+    def get_total_results(self, response_json):
+        return response_json["header"]["numFound"]
+
+
+# Stateless, so one instance serves every full-stack test
+HEADER_RESULTS_UNWRAPPER = HeaderResultsUnwrapper()
+
+
+def _serve_page_items(request: httpx.Request) -> httpx.Response:
+    """Serve PAGE_ITEMS with cursor or page pagination and an optional id filter."""
+    params = request.url.params
+    items = [i for i in PAGE_ITEMS if params.get("id", i["id"]) == i["id"]]
+    size = int(params["pageSize"])
+    if "cursor" in params:
+        start = 0 if params["cursor"] == "*" else int(params["cursor"])
+    else:
+        start = (int(params.get("page", 1)) - 1) * size
+    end = start + size
+    header = {
+        "numFound": len(items),
+        "nextCursor": str(end) if end < len(items) else None,
+    }
+    return httpx.Response(200, json={"header": header, "results": items[start:end]})
+
+
+@pytest.fixture
+async def transport_api_client():
+    """A real BaseApiClient whose HTTP traffic is served by an httpx.MockTransport."""
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return _serve_page_items(request)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    api_client = BaseApiClient(
+        settings=BaseApiSettings(max_retries=0),
+        response_unwrapper=HEADER_RESULTS_UNWRAPPER,
+        base_url="https://api.example.com",
+        http_client=http_client,
+    )
+    api_client.sent_requests = sent
+    yield api_client
+    await http_client.aclose()
+
+
+class TransportCursorClient(CursorIterableMixin, BaseResourceClient):
+    _entity_path = "test_entities"
+    _entity_model = MockEntityModel
+
+
+class TransportPageClient(PageIterableMixin, BaseResourceClient):
+    _entity_path = "test_entities"
+    _entity_model = MockEntityModel
+
+
+class TransportGettableClient(GettableMixin, BaseResourceClient):
+    _entity_path = "test_entities"
+    _entity_model = MockEntityModel
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("client_cls", "iterate_kwargs"),
+    [
+        (TransportCursorClient, {}),
+        (TransportCursorClient, {"prefetch": True}),
+        (TransportPageClient, {}),
+        (TransportPageClient, {"concurrency": 2}),
+    ],
+)
+async def test_iterate_through_client_stack(
+    client_cls, iterate_kwargs, transport_api_client
+):
+    """iterate() works end to end through BaseApiClient, unwrapper and transport."""
+    client = client_cls(transport_api_client)
+
+    results = [
+        item
+        async for item in client.iterate(
+            page_size=2, filters={"type": "article"}, **iterate_kwargs
+        )
+    ]
+
+    assert results == PAGE_ENTITIES
+    sent = transport_api_client.sent_requests
+    assert len(sent) == 2  # noqa: PLR2004
+    assert all(r.url.path == "/test_entities" for r in sent)
+    assert all(r.url.params["type"] == "article" for r in sent)
+
+
+@pytest.mark.asyncio
+async def test_get_through_client_stack(transport_api_client):
+    """get() resolves an entity by ID through the full client stack."""
+    client = TransportGettableClient(transport_api_client)
+
+    assert await client.get("2") == PAGE_ENTITIES[1]
+    (request,) = transport_api_client.sent_requests
+    assert request.url.params["id"] == "2"
@@ -1,13 +1,12 @@
 """Additional tests for resources.py to cover pagination edge cases, sort validation, and filter conversion."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 from pydantic import BaseModel, Field
 
-from bibliofabric.client import BaseApiClient
 from bibliofabric.exceptions import BibliofabricError
-from bibliofabric.models import ResponseUnwrapper
 from bibliofabric.resources import (
     BaseResourceClient,
     CursorIterableMixin,
@@ -36,18 +35,6 @@ class SampleFilter(BaseModel):
     category: str | None = None
 
 
-@pytest.fixture
-def mock_api_client():
-    client = AsyncMock(spec=BaseApiClient)
-    client._response_unwrapper = MagicMock(spec=ResponseUnwrapper)
-    return client
-
-
-@pytest.fixture
-def mock_unwrapper():
-    return MagicMock(spec=ResponseUnwrapper)
-
-
 class ConcreteResourceClient(BaseResourceClient):
     _entity_path = "test_entities"
     _entity_model = MockEntityModel
@@ -90,8 +77,7 @@ async def test_gettable_direct_get_model_parse_fallback(
     """Test direct get with model parsing failure returns raw data (lines 183-188)."""
     client = GettableDirectGetClient(mock_api_client, mock_unwrapper)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"id": "123", "wrong_field": "data"}
+    mock_response = httpx.Response(200, json={"id": "123", "wrong_field": "data"})
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_single_item.return_value = {
         "id": "123",
@@ -167,8 +153,7 @@ async def test_searchable_pydantic_filter_conversion(mock_api_client, mock_unwra
     """Test that Pydantic model filters are properly converted (line 254)."""
     client = SearchableTestClient(mock_api_client, mock_unwrapper)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": [], "numFound": 0}
+    mock_response = httpx.Response(200, json={"results": [], "numFound": 0})
     mock_api_client.request = AsyncMock(return_value=mock_response)
 
     filter_model = SampleFilter(search_term="test")
@@ -191,15 +176,6 @@ class CursorIterableTestClient(CursorIterableMixin, ConcreteResourceClient):
     _entity_path = "test_entities"
 
 
-@pytest.mark.asyncio
-async def test_cursor_iterable_no_entity_path_raises(mock_api_client, mock_unwrapper):
-    """Test that iterate() raises when _entity_path is empty (line 346)."""
-    client = CursorIterableNoPathClient(mock_api_client, mock_unwrapper)
-    with pytest.raises(BibliofabricError, match="must define _entity_path"):
-        async for _ in client.iterate():
-            pass
-
-
 @pytest.mark.asyncio
 async def test_cursor_iterable_invalid_filter_type_raises(
     mock_api_client, mock_unwrapper
@@ -214,12 +190,13 @@ async def test_cursor_iterable_invalid_filter_type_raises(
 
 
 @pytest.mark.asyncio
-async def test_cursor_iterable_with_sort(mock_api_client, mock_unwrapper):
+async def test_cursor_iterable_with_sort(
+    mock_api_client, mock_unwrapper, empty_page_json
+):
     """Test that sort_by is passed as parameter (line 376)."""
     client = CursorIterableTestClient(mock_api_client, mock_unwrapper)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": [], "header": {}}
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_results.return_value = []
     mock_unwrapper.get_next_page_token.return_value = None
@@ -231,39 +208,14 @@ async def test_cursor_iterable_with_sort(mock_api_client, mock_unwrapper):
     assert call_args[1]["params"]["sortBy"] == "title ASC"
 
 
-@pytest.mark.asyncio
-async def test_cursor_iterable_unexpected_error_wraps(mock_api_client, mock_unwrapper):
-    """Test that unexpected errors during iteration are wrapped (lines 434-440)."""
-    client = CursorIterableTestClient(mock_api_client, mock_unwrapper)
-    mock_api_client.request = AsyncMock(side_effect=ValueError("unexpected"))
-
-    with pytest.raises(BibliofabricError, match="Unexpected error during iteration"):
-        async for _ in client.iterate():
-            pass
-
-
-@pytest.mark.asyncio
-async def test_cursor_iterable_bibliofabric_error_reraise(
-    mock_api_client, mock_unwrapper
-):
-    """Test that BibliofabricError during iteration is re-raised as-is (line 436)."""
-    client = CursorIterableTestClient(mock_api_client, mock_unwrapper)
-    mock_api_client.request = AsyncMock(side_effect=BibliofabricError("original error"))
-
-    with pytest.raises(BibliofabricError, match="original error"):
-        async for _ in client.iterate():
-            pass
-
-
 @pytest.mark.asyncio
 async def test_cursor_iterable_pydantic_filter_conversion(
-    mock_api_client, mock_unwrapper
+    mock_api_client, mock_unwrapper, empty_page_json
 ):
     """Test that Pydantic model filters are properly converted in cursor iterable (line 354)."""
     client = CursorIterableTestClient(mock_api_client, mock_unwrapper)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": [], "header": {}}
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_results.return_value = []
     mock_unwrapper.get_next_page_token.return_value = None
@@ -288,15 +240,6 @@ class PageIterableTestClient(PageIterableMixin, ConcreteResourceClient):
     _entity_path = "test_entities"
 
 
-@pytest.mark.asyncio
-async def test_page_iterable_no_entity_path_raises(mock_api_client, mock_unwrapper):
-    """Test that iterate() raises when _entity_path is empty (line 482)."""
-    client = PageIterableNoPathClient(mock_api_client, mock_unwrapper)
-    with pytest.raises(BibliofabricError, match="must define _entity_path"):
-        async for _ in client.iterate():
-            pass
-
-
 @pytest.mark.asyncio
 async def test_page_iterable_invalid_filter_type_raises(
     mock_api_client, mock_unwrapper
@@ -311,12 +254,13 @@ async def test_page_iterable_invalid_filter_type_raises(
 
 
 @pytest.mark.asyncio
-async def test_page_iterable_with_sort_and_validation(mock_api_client, mock_unwrapper):
+async def test_page_iterable_with_sort_and_validation(
+    mock_api_client, mock_unwrapper, empty_page_json
+):
     """Test that sort_by passes through _validate_sort_field (lines 499-500)."""
     client = PageIterableTestClient(mock_api_client, mock_unwrapper)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": []}
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_results.return_value = []
 
@@ -336,8 +280,7 @@ async def test_page_iterable_no_entity_model_yields_raw(
     client._entity_model = None
 
     page1_data = [{"id": "1", "value": "a"}, {"id": "2", "value": "b"}]
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": page1_data, "total": 2}
+    mock_response = httpx.Response(200, json={"results": page1_data, "total": 2})
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_results.return_value = page1_data
     mock_unwrapper.get_total_results.return_value = EXPECTED_TWO_ITEMS
@@ -353,8 +296,7 @@ async def test_page_iterable_parsing_error_yields_raw(mock_api_client, mock_unwr
     client = PageIterableTestClient(mock_api_client, mock_unwrapper)
 
     page1_data = [{"id": "1"}]
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": page1_data, "total": 1}
+    mock_response = httpx.Response(200, json={"results": page1_data, "total": 1})
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_results.return_value = page1_data
     mock_unwrapper.get_total_results.return_value = 1
@@ -364,39 +306,14 @@ async def test_page_iterable_parsing_error_yields_raw(mock_api_client, mock_unwr
     assert results[0] == {"id": "1"}
 
 
-@pytest.mark.asyncio
-async def test_page_iterable_unexpected_error_wraps(mock_api_client, mock_unwrapper):
-    """Test that unexpected errors during page iteration are wrapped (lines 562-568)."""
-    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
-    mock_api_client.request = AsyncMock(side_effect=ValueError("unexpected"))
-
-    with pytest.raises(BibliofabricError, match="Unexpected error during iteration"):
-        async for _ in client.iterate():
-            pass
-
-
-@pytest.mark.asyncio
-async def test_page_iterable_bibliofabric_error_reraise(
-    mock_api_client, mock_unwrapper
-):
-    """Test that BibliofabricError during page iteration is re-raised as-is (line 564)."""
-    client = PageIterableTestClient(mock_api_client, mock_unwrapper)
-    mock_api_client.request = AsyncMock(side_effect=BibliofabricError("original error"))
-
-    with pytest.raises(BibliofabricError, match="original error"):
-        async for _ in client.iterate():
-            pass
-
-
 @pytest.mark.asyncio
 async def test_page_iterable_pydantic_filter_conversion(
-    mock_api_client, mock_unwrapper
+    mock_api_client, mock_unwrapper, empty_page_json
 ):
     """Test that Pydantic model filters are properly converted in page iterable (line 490)."""
     client = PageIterableTestClient(mock_api_client, mock_unwrapper)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": []}
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_results.return_value = []
 
@@ -410,12 +327,13 @@ async def test_page_iterable_pydantic_filter_conversion(
 
 
 @pytest.mark.asyncio
-async def test_page_iterable_dict_filter_conversion(mock_api_client, mock_unwrapper):
+async def test_page_iterable_dict_filter_conversion(
+    mock_api_client, mock_unwrapper, empty_page_json
+):
     """Test that dict filters are properly converted in page iterable (line 492)."""
     client = PageIterableTestClient(mock_api_client, mock_unwrapper)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"results": []}
+    mock_response = httpx.Response(200, json=empty_page_json)
     mock_api_client.request = AsyncMock(return_value=mock_response)
     mock_unwrapper.unwrap_results.return_value = []
 
@@ -425,3 +343,58 @@ async def test_page_iterable_dict_filter_conversion(mock_api_client, mock_unwrap
     call_args = mock_api_client.request.call_args
     params = call_args[1]["params"]
     assert params["key"] == "value"
+
+
+# --- Error handling shared by both iteration mixins ---
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_cls",
+    [CursorIterableNoPathClient, PageIterableNoPathClient],
+    ids=["cursor", "page"],
+)
+async def test_iterable_no_entity_path_raises(
+    client_cls, mock_api_client, mock_unwrapper
+):
+    """Test that iterate() raises when _entity_path is empty."""
+    client = client_cls(mock_api_client, mock_unwrapper)
+    with pytest.raises(BibliofabricError, match="must define _entity_path"):
+        async for _ in client.iterate():
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_cls",
+    [CursorIterableTestClient, PageIterableTestClient],
+    ids=["cursor", "page"],
+)
+async def test_iterable_unexpected_error_wraps(
+    client_cls, mock_api_client, mock_unwrapper
+):
+    """Test that unexpected errors during iteration are wrapped."""
+    client = client_cls(mock_api_client, mock_unwrapper)
+    mock_api_client.request = AsyncMock(side_effect=ValueError("unexpected"))
+
+    with pytest.raises(BibliofabricError, match="Unexpected error during iteration"):
+        async for _ in client.iterate():
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_cls",
+    [CursorIterableTestClient, PageIterableTestClient],
+    ids=["cursor", "page"],
+)
+async def test_iterable_bibliofabric_error_reraise(
+    client_cls, mock_api_client, mock_unwrapper
+):
+    """Test that BibliofabricError during iteration is re-raised as-is."""
+    client = client_cls(mock_api_client, mock_unwrapper)
+    mock_api_client.request = AsyncMock(side_effect=BibliofabricError("original error"))
+
+    with pytest.raises(BibliofabricError, match="original error"):
+        async for _ in client.iterate():
+            pass